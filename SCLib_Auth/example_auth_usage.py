@@ -6,7 +6,6 @@ Demonstrates how to use the standalone authentication system.
 
 import requests
 import json
-import time
 from typing import Dict, Any
 
 class SCLibAuthClient:
@@ -247,9 +246,9 @@ def main():
     else:
         print("   ❌ Token refresh failed")
     
-    # Wait a moment
-    print("\n7. Waiting 2 seconds...")
-    time.sleep(2)
+    # Validate the refreshed token
+    print("\n7. Validating refreshed token...")
+    client.check_auth_status()
     
     # Logout
     print("\n8. Logging out...")
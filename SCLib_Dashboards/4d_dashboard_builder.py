@@ -154,8 +154,12 @@ class DashboardBuilder:
             }
         )
         
-        # Create SessionStateHistory for undo/redo
-        self.session_history = SessionStateHistory(self.session, max_history=20)
+        # Create SessionStateHistory for undo/redo; the initial snapshot is
+        # serialized on the next server tick instead of during construction
+        from bokeh.io import curdoc
+        self.session_history = SessionStateHistory(
+            self.session, max_history=20, schedule=curdoc().add_next_tick_callback
+        )
     
     def create_plot1(self) -> bool:
         """
@@ -224,6 +224,11 @@ try:
         create_4d_session_from_process_4dnexus,
     )
     from SCLib_Dashboards.SCDashUI_undo_redo import SessionStateHistory
+    from bokeh.io import curdoc
+
+    # Undo histories capture their initial state now but serialize it on the
+    # next server tick, keeping that work off the dashboard construction path
+    history_schedule = curdoc().add_next_tick_callback
 
     # Create FourDDashboardSession for state management
     # This specialized session includes all 4D-specific dataset selections
@@ -236,7 +241,7 @@ try:
     # NOTE: State history saves with include_data=False, so it only stores UI settings,
     # not data arrays. This keeps undo/redo fast and memory-efficient.
     # Reduced max_history from 100 to 20 for better performance (fewer deep copies)
-    session_history = SessionStateHistory(session, max_history=20)
+    session_history = SessionStateHistory(session, max_history=20, schedule=history_schedule)
 
     # Import Bokeh components
     from bokeh.models import (
@@ -545,7 +550,7 @@ try:
     # Add plot to session and create history
     if plot1_is_1d and plot1_1d_plot is not None:
         # Already added to session above
-        plot1_history = PlotStateHistory(plot1_1d_plot, max_history=20)
+        plot1_history = PlotStateHistory(plot1_1d_plot, max_history=20, schedule=history_schedule)
         # For 1D plot, use the 1D data and coordinates
         plot1_data = None  # Not used for 1D line plot
         plot1_x_coords = plot1_1d_x_coords
@@ -555,7 +560,7 @@ try:
         session.add_plot("plot1", map_plot)
         # Create plot history for undo/redo
         # Reduced max_history from 50 to 20 for better performance
-        plot1_history = PlotStateHistory(map_plot, max_history=20)
+        plot1_history = PlotStateHistory(map_plot, max_history=20, schedule=history_schedule)
         # Get flipped data and coordinates for Bokeh plot - ALWAYS use flipped methods
         # This ensures consistency - if needs_flip is True, these return flipped versions
         plot1_data = map_plot.get_flipped_data()
@@ -1163,7 +1168,7 @@ try:
         # Add to session
         session.add_plot("plot2", probe_1d_plot)
         # Reduced max_history from 50 to 20 for better performance
-        plot2_history = PlotStateHistory(probe_1d_plot, max_history=20)
+        plot2_history = PlotStateHistory(probe_1d_plot, max_history=20, schedule=history_schedule)
 
         # Create Bokeh figure (smaller size: 300x300)
         # For 1D plots, add BoxSelectTool configured for x-range selection only (bar selection)
@@ -1324,7 +1329,7 @@ try:
         # Add to session
         session.add_plot("plot2", probe_2d_plot)
         # Reduced max_history from 50 to 20 for better performance
-        plot2_history = PlotStateHistory(probe_2d_plot, max_history=20)
+        plot2_history = PlotStateHistory(probe_2d_plot, max_history=20, schedule=history_schedule)
 
         # Prepare data and coordinates for Bokeh plot using PROBE_2DPlot flipped methods
         # The probe_2d_plot object handles all flipping logic internally
@@ -5,7 +5,14 @@ This module provides factory functions for creating common Bokeh UI widgets
 with consistent styling and behavior.
 """
 
-from typing import Optional, List, Callable, Any, Dict
+import html
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional, List, Callable, Any, Dict, Iterator, Tuple
+from bokeh.io import curdoc
 from bokeh.models import (
     Select,
     Slider,
@@ -16,6 +23,206 @@ from bokeh.models import (
     Div,
 )
 
+# Minimal widget margin (top, right, bottom, left) - minimal vertical spacing
+_MIN_MARGIN = (1, 0, 1, 0)
+
+
+class WidgetPool:
+    """
+    Pool of reusable Bokeh widgets, bucketed by document and widget class.
+    
+    Dashboards that rebuild their selection layouts (e.g., on re-initialization)
+    can release the widgets of the discarded layout back to the pool, so the
+    next build updates existing models instead of constructing new ones.
+    
+    Widgets are only handed out again in the document they were released from,
+    because a Bokeh model can belong to a single document and sessions must not
+    share widgets. Released widgets are reset to their class defaults and lose
+    their Python and JS callbacks.
+    """
+    
+    def __init__(self):
+        """Initialize an empty widget pool."""
+        self._buckets: "weakref.WeakKeyDictionary[Any, Dict[type, List[Any]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def acquire(self, widget_cls: type, **kwargs) -> Any:
+        """
+        Get a widget of the given class, reusing a pooled one if available.
+        
+        Args:
+            widget_cls: Bokeh widget class
+            **kwargs: Properties to set on the widget
+            
+        Returns:
+            Widget instance with the given properties applied
+        """
+        doc = _current_document()
+        buckets = self._buckets.get(doc) if doc is not None else None
+        bucket = buckets.get(widget_cls) if buckets else None
+        if bucket:
+            widget = bucket.pop()
+            widget.update(**kwargs)
+            return widget
+        return widget_cls(**kwargs)
+    
+    def release(self, widget: Any) -> None:
+        """
+        Return a widget to the pool.
+        
+        The widget's callbacks are cleared and its properties are reset to the
+        class defaults. Only release widgets that are no longer part of any
+        layout. Widgets outside any document are dropped.
+        
+        Args:
+            widget: Widget to return to the pool
+        """
+        doc = widget.document or _current_document()
+        if doc is None:
+            return
+        callbacks = getattr(widget, "_callbacks", None)
+        if callbacks is not None:
+            callbacks.clear()
+        event_callbacks = getattr(widget, "_event_callbacks", None)
+        if event_callbacks is not None:
+            event_callbacks.clear()
+        # Drops stale visible/disabled/... values along with js_property_callbacks
+        widget_cls = type(widget)
+        widget.update(**{
+            name: widget.lookup(name).class_default(widget_cls)
+            for name in widget.properties_with_values(include_defaults=False)
+        })
+        buckets = self._buckets.get(doc)
+        if buckets is None:
+            buckets = self._buckets[doc] = defaultdict(list)
+        buckets[widget_cls].append(widget)
+    
+    def clear(self) -> None:
+        """Drop all pooled widgets."""
+        self._buckets.clear()
+
+
+def _current_document() -> Optional[Any]:
+    """Return the current Bokeh document, or None if there is none."""
+    try:
+        return curdoc()
+    except Exception:
+        return None
+
+
+@contextmanager
+def hold_document(policy: str = "collect") -> Iterator[Optional[Any]]:
+    """
+    Hold change events on the current document for the duration of the block.
+    
+    Property changes made inside the block are coalesced and sent to the
+    browser as one patch when the block exits. Outside a Bokeh server context,
+    or if the document is already held by an enclosing block, this is a no-op.
+    
+    Args:
+        policy: Hold policy ("collect" or "combine")
+        
+    Yields:
+        The held document, or None if nothing was held
+    """
+    try:
+        doc = curdoc()
+    except Exception:
+        doc = None
+    
+    if doc is None:
+        yield None
+        return
+    
+    callbacks = getattr(doc, "callbacks", None)
+    already_held = getattr(callbacks, "hold_value", getattr(doc, "_hold", None)) is not None
+    if already_held:
+        yield doc
+        return
+    
+    doc.hold(policy)
+    try:
+        yield doc
+    finally:
+        doc.unhold()
+
+
+# Pending (widget, attr, callback) registrations while inside batch_callbacks()
+_callback_queue: ContextVar[Optional[List[Tuple[Any, Optional[str], Callable]]]] = ContextVar(
+    "_callback_queue", default=None
+)
+
+
+def _register_callback(widget: Any, attr: Optional[str], callback: Callable) -> None:
+    """
+    Attach a callback to a widget, or queue it when callbacks are being batched.
+    
+    Args:
+        widget: Widget to attach the callback to
+        attr: Property name for on_change, or None for on_click
+        callback: Callback function
+    """
+    queue = _callback_queue.get()
+    if queue is not None:
+        queue.append((widget, attr, callback))
+    elif attr is None:
+        widget.on_click(callback)
+    else:
+        widget.on_change(attr, callback)
+
+
+@contextmanager
+def batch_callbacks() -> Iterator[None]:
+    """
+    Defer callback registration by the widget factories until the block exits.
+    
+    The queued callbacks are attached in one pass while the current document is
+    held, so the events fired during dashboard construction are coalesced.
+    Nested blocks are folded into the outermost one. Nothing is attached if the
+    block raises.
+    """
+    if _callback_queue.get() is not None:
+        yield
+        return
+    
+    queue: List[Tuple[Any, Optional[str], Callable]] = []
+    token = _callback_queue.set(queue)
+    try:
+        yield
+    finally:
+        _callback_queue.reset(token)
+    
+    with hold_document():
+        for widget, attr, callback in queue:
+            if attr is None:
+                widget.on_click(callback)
+            else:
+                widget.on_change(attr, callback)
+
+
+# Pool used by the widget factories (per document)
+_widget_pool = WidgetPool()
+
+# Free lists for spacer/separator Divs, which are created in bulk by layouts
+_spacer_pool = WidgetPool()
+_separator_pool = WidgetPool()
+_spacers: "weakref.WeakSet[Div]" = weakref.WeakSet()
+_separators: "weakref.WeakSet[Div]" = weakref.WeakSet()
+
+
+def release_widgets(*widgets: Any) -> None:
+    """
+    Return widgets to the widget pool so later factory calls in the same
+    document can reuse them.
+    
+    Args:
+        *widgets: Widgets that are no longer displayed (None entries are ignored)
+    """
+    for widget in widgets:
+        if widget is not None:
+            _widget_pool.release(widget)
+
 
 def create_select(
     title: str,
@@ -37,7 +244,8 @@ def create_select(
     Returns:
         Select widget
     """
-    widget = Select(
+    widget = _widget_pool.acquire(
+        Select,
         title=title,
         value=value,
         options=options or [],
@@ -45,7 +253,7 @@ def create_select(
     )
     
     if callback:
-        widget.on_change("value", callback)
+        _register_callback(widget, "value", callback)
     
     return widget
 
@@ -87,7 +295,7 @@ def create_slider(
     )
     
     if callback:
-        widget.on_change("value", callback)
+        _register_callback(widget, "value", callback)
     
     return widget
 
@@ -120,14 +328,14 @@ def create_button(
     widget = Button(**kwargs)
     
     # Set minimal margin to reduce spacing
-    widget.margin = (1, 0, 1, 0)  # (top, right, bottom, left) - minimal vertical spacing
+    widget.margin = _MIN_MARGIN
     
     # Add CSS class based on button_type for styling
     if button_type and button_type != "default":
         widget.css_classes = [f"bk-btn-{button_type}"]
     
     if callback:
-        widget.on_click(callback)
+        _register_callback(widget, None, callback)
     
     return widget
 
@@ -163,10 +371,10 @@ def create_toggle(
     widget = Toggle(**kwargs)
     
     # Set minimal margin to reduce spacing
-    widget.margin = (1, 0, 1, 0)  # (top, right, bottom, left) - minimal vertical spacing
+    widget.margin = _MIN_MARGIN
     
     if callback:
-        widget.on_change("active", callback)
+        _register_callback(widget, "active", callback)
     
     return widget
 
@@ -177,6 +385,7 @@ def create_text_input(
     width: int = 120,
     callback: Optional[Callable] = None,
     placeholder: Optional[str] = None,
+    live_callback: Optional[Callable] = None,
 ) -> TextInput:
     """
     Create a TextInput widget.
@@ -185,8 +394,11 @@ def create_text_input(
         title: Input title/label
         value: Default value
         width: Widget width in pixels
-        callback: Optional callback function (attr, old, new)
+        callback: Optional callback function (attr, old, new), bound to "value"
+            (fires on Enter/blur)
         placeholder: Optional placeholder text
+        live_callback: Optional callback bound to "value_input" (fires on every
+            keystroke; should be debounced)
         
     Returns:
         TextInput widget
@@ -202,10 +414,12 @@ def create_text_input(
     widget = TextInput(**kwargs)
     
     # Set minimal margin to reduce spacing
-    widget.margin = (1, 0, 1, 0)  # (top, right, bottom, left) - minimal vertical spacing
+    widget.margin = _MIN_MARGIN
     
     if callback:
-        widget.on_change("value", callback)
+        _register_callback(widget, "value", callback)
+    if live_callback:
+        _register_callback(widget, "value_input", live_callback)
     
     return widget
 
@@ -235,13 +449,13 @@ def create_radio_button_group(
     if width is not None:
         kwargs["width"] = width
     
-    widget = RadioButtonGroup(**kwargs)
+    widget = _widget_pool.acquire(RadioButtonGroup, **kwargs)
     
     # Set minimal margin to reduce spacing
-    widget.margin = (1, 0, 1, 0)  # (top, right, bottom, left) - minimal vertical spacing
+    widget.margin = _MIN_MARGIN
     
     if callback:
-        widget.on_change("active", callback)
+        _register_callback(widget, "active", callback)
     
     return widget
 
@@ -275,6 +489,12 @@ def create_div(
     return Div(**kwargs)
 
 
+@lru_cache(maxsize=256)
+def _label_template(text: str) -> str:
+    """Escape label text and wrap it in bold tags (memoized; labels repeat across plots)."""
+    return f"<b>{html.escape(text)}</b>"
+
+
 def create_label_div(
     text: str,
     width: Optional[int] = None,
@@ -284,14 +504,14 @@ def create_label_div(
     Create a Div widget formatted as a label.
     
     Args:
-        text: Label text
+        text: Label text (HTML-escaped when bold)
         width: Optional width in pixels
         bold: Whether to make text bold
         
     Returns:
         Div widget with label styling
     """
-    html_text = f"<b>{text}</b>" if bold else text
+    html_text = _label_template(text) if bold else text
     return create_div(text=html_text, width=width)
 
 
@@ -302,6 +522,8 @@ def create_spacer(
     """
     Create an empty Div widget for spacing.
     
+    Spacers released with release_spacers() are reused before new ones are built.
+    
     Args:
         width: Optional width in pixels
         height: Optional height in pixels
@@ -309,7 +531,9 @@ def create_spacer(
     Returns:
         Empty Div widget
     """
-    return create_div(text="", width=width, height=height)
+    widget = _spacer_pool.acquire(Div, text="", width=width, height=height)
+    _spacers.add(widget)
+    return widget
 
 
 def create_separator(
@@ -318,11 +542,38 @@ def create_separator(
     """
     Create a horizontal separator (hr) Div.
     
+    Separators released with release_spacers() are reused before new ones are built.
+    
     Args:
         width: Optional width in pixels
         
     Returns:
         Div widget with horizontal rule
     """
-    return create_div(text="<hr>", width=width)
+    widget = _separator_pool.acquire(Div, text="<hr>", width=width)
+    _separators.add(widget)
+    return widget
+
 
+def release_spacers(layout: Any) -> None:
+    """
+    Return the spacer and separator Divs of a discarded layout to their free lists.
+    
+    Walks the layout tree and recycles every Div created by create_spacer() or
+    create_separator(). Only call this once the layout is no longer displayed.
+    
+    Args:
+        layout: Root of the discarded layout
+    """
+    stack = [layout]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            # GridBox children are (model, row, col) tuples
+            item = item[0]
+        if item in _spacers:
+            _spacer_pool.release(item)
+        elif item in _separators:
+            _separator_pool.release(item)
+        else:
+            stack.extend(getattr(item, "children", None) or ())
@@ -5,7 +5,8 @@ This module provides UI components for selecting datasets and coordinates,
 including mode selectors (single dataset vs ratio) and coordinate selectors.
 """
 
-from typing import Optional, List, Callable, Tuple, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Callable, Tuple, Dict, Any, Union, NamedTuple
 from bokeh.models import Select, RadioButtonGroup, Toggle
 from bokeh.layouts import column, row
 
@@ -14,9 +15,85 @@ from .SCDashUI_base_components import (
     create_radio_button_group,
     create_toggle,
     create_label_div,
+    release_widgets,
+    hold_document,
+    batch_callbacks,
 )
 
 
+# Fallback option shown when a selector has no datasets
+_NO_DATASETS = "No datasets available"
+
+# Placeholder selections that carry no path/shape information
+_SENTINELS = frozenset({
+    "No 2D datasets",
+    "No 3D/4D datasets",
+    "Use Default",
+    _NO_DATASETS,
+})
+
+
+class OptionsRegistry:
+    """
+    Keeps Select option lists that are shared by several selectors in sync.
+    
+    Each options list is stored once under a key. Bound Selects hold the list
+    as their own options, so Python-side reads always see the real choices,
+    and update() replaces the list on every bound Select in one document patch.
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._options: Dict[str, List[str]] = {}
+        self._selects: Dict[str, List[Select]] = {}
+    
+    def register(self, key: str, options: List[str]) -> None:
+        """
+        Store an options list under a key (replacing any previous list).
+        
+        Args:
+            key: Name of the options list
+            options: Option strings
+        """
+        self._options[key] = list(options)
+    
+    def options(self, key: str) -> List[str]:
+        """
+        Get a registered options list.
+        
+        Args:
+            key: Name of the options list
+            
+        Returns:
+            Copy of the option strings
+        """
+        return list(self._options[key])
+    
+    def bind(self, select: Select, key: str) -> None:
+        """
+        Make a Select take its options from the registered list.
+        
+        Args:
+            select: Select widget
+            key: Name of a registered options list
+        """
+        select.options = list(self._options[key])
+        self._selects.setdefault(key, []).append(select)
+    
+    def update(self, key: str, options: List[str]) -> None:
+        """
+        Replace an options list and the options of every Select bound to it.
+        
+        Args:
+            key: Name of the options list
+            options: New option strings
+        """
+        self.register(key, options)
+        with hold_document():
+            for select in self._selects.get(key, ()):
+                select.options = list(self._options[key])
+
+
 def create_dataset_selector(
     title: str,
     choices: List[str],
@@ -38,7 +115,7 @@ def create_dataset_selector(
         Select widget
     """
     if not choices:
-        choices = ["No datasets available"]
+        choices = [_NO_DATASETS]
     
     value = default_value if default_value is not None else choices[0]
     
@@ -80,6 +157,14 @@ def create_mode_selector(
     )
 
 
+def _build_options(default_value: str, choices: Optional[List[str]]) -> List[str]:
+    """Build a coordinate selector's options list with the default entry first."""
+    options = [default_value]
+    if choices:
+        options.extend(choices)
+    return options
+
+
 def create_coordinate_selector(
     title: str,
     choices: List[str],
@@ -100,7 +185,7 @@ def create_coordinate_selector(
     Returns:
         Select widget
     """
-    options = [default_value] + choices if choices else [default_value]
+    options = _build_options(default_value, choices)
     
     return create_select(
         title=title,
@@ -111,6 +196,65 @@ def create_coordinate_selector(
     )
 
 
+class LazySelect:
+    """
+    Deferred Select widget that is only built when first needed.
+    
+    Attribute reads and writes are forwarded to the underlying widget, which
+    is constructed on first access (or by calling get()).
+    """
+    
+    __slots__ = ("_factory", "_widget")
+    
+    def __init__(self, factory: Callable[[], Select]):
+        """
+        Initialize the lazy selector.
+        
+        Args:
+            factory: Zero-argument callable that builds the Select widget
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_widget", None)
+    
+    @property
+    def is_built(self) -> bool:
+        """Check if the underlying widget has been built."""
+        return self._widget is not None
+    
+    def get(self) -> Select:
+        """
+        Get the underlying widget, building it on first call.
+        
+        Returns:
+            Select widget
+        """
+        if self._widget is None:
+            object.__setattr__(self, "_widget", self._factory())
+        return self._widget
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.get(), name, value)
+
+
+class DatasetSelectionGroup(NamedTuple):
+    """Widgets returned by create_dataset_selection_group (unpacks like a 4-tuple)."""
+    mode: RadioButtonGroup
+    single: Select
+    numerator: Union[Select, LazySelect]
+    denominator: Union[Select, LazySelect]
+
+
+class CoordinateSelectionGroup(NamedTuple):
+    """Widgets returned by create_coordinate_selection_group (unpacks like a 4-tuple)."""
+    map_x: Select
+    map_y: Select
+    probe_x: Select
+    probe_y: Select
+
+
 def create_dataset_selection_group(
     plot_label: str,
     dataset_choices: List[str],
@@ -122,7 +266,10 @@ def create_dataset_selection_group(
     dataset_callback: Optional[Callable] = None,
     numerator_callback: Optional[Callable] = None,
     denominator_callback: Optional[Callable] = None,
-) -> Tuple[RadioButtonGroup, Select, Select, Select]:
+    lazy_ratio_selectors: bool = False,
+    ratio_container: Optional[Any] = None,
+    options_registry: Optional[OptionsRegistry] = None,
+) -> DatasetSelectionGroup:
     """
     Create a complete dataset selection group with mode selector and dataset selectors.
     
@@ -137,45 +284,107 @@ def create_dataset_selection_group(
         dataset_callback: Callback for single dataset change
         numerator_callback: Callback for numerator change
         denominator_callback: Callback for denominator change
+        lazy_ratio_selectors: If True and default_mode is single dataset (0), defer
+            building the numerator/denominator selectors until ratio mode is chosen
+        ratio_container: Optional layout whose children receive the ratio selectors
+            when they are built lazily
+        options_registry: Optional registry that keeps the dataset list of all
+            selectors in sync (lazily built ratio selectors are not bound)
         
     Returns:
-        Tuple of (mode_selector, single_dataset_selector, numerator_selector, denominator_selector)
+        DatasetSelectionGroup of (mode, single, numerator, denominator) selectors.
+        With lazy ratio selectors, the last two are LazySelect proxies.
+        
+    Note:
+        The selectors are taken from the widget pool; pass the widgets of a
+        discarded group to release_selection_group() so a rebuild can reuse them.
     """
-    # Mode selector
-    mode_selector = create_mode_selector(
-        labels=mode_labels,
-        active=default_mode,
-        width=width + 100,
-        callback=mode_callback
-    )
+    # Resolve the options once; all three dataset selectors share this list
+    choices = list(dataset_choices) if dataset_choices else [_NO_DATASETS]
     
-    # Single dataset selector
-    single_dataset_selector = create_dataset_selector(
-        title=f"{plot_label} Dataset (2D):",
-        choices=dataset_choices,
-        default_value=default_dataset,
-        width=width,
-        callback=dataset_callback
-    )
+    def build_numerator() -> Select:
+        return create_dataset_selector(
+            title=f"{plot_label} Numerator (2D):",
+            choices=choices,
+            default_value=default_dataset,
+            width=width,
+            callback=numerator_callback
+        )
     
-    # Ratio selectors
-    numerator_selector = create_dataset_selector(
-        title=f"{plot_label} Numerator (2D):",
-        choices=dataset_choices,
-        default_value=default_dataset,
-        width=width,
-        callback=numerator_callback
-    )
+    def build_denominator() -> Select:
+        return create_dataset_selector(
+            title=f"{plot_label} Denominator (2D):",
+            choices=choices,
+            default_value=default_dataset,
+            width=width,
+            callback=denominator_callback
+        )
     
-    denominator_selector = create_dataset_selector(
-        title=f"{plot_label} Denominator (2D):",
-        choices=dataset_choices,
-        default_value=default_dataset,
-        width=width,
-        callback=denominator_callback
-    )
+    lazy = lazy_ratio_selectors and default_mode == 0
+    selector_mode_callback = mode_callback
+    if lazy:
+        numerator_selector = LazySelect(build_numerator)
+        denominator_selector = LazySelect(build_denominator)
+        
+        def selector_mode_callback(attr, old, new):
+            # Build the ratio selectors the first time ratio mode is chosen
+            if new == 1 and not numerator_selector.is_built:
+                with hold_document():
+                    built = [numerator_selector.get(), denominator_selector.get()]
+                    if ratio_container is not None:
+                        ratio_container.children = list(ratio_container.children) + built
+            if mode_callback is not None:
+                mode_callback(attr, old, new)
+    
+    # Coalesce widget creation and callback attachment into one document patch
+    with hold_document(), batch_callbacks():
+        # Mode selector
+        mode_selector = create_mode_selector(
+            labels=mode_labels,
+            active=default_mode,
+            width=width + 100,
+            callback=selector_mode_callback
+        )
     
-    return mode_selector, single_dataset_selector, numerator_selector, denominator_selector
+        # Single dataset selector
+        single_dataset_selector = create_dataset_selector(
+            title=f"{plot_label} Dataset (2D):",
+            choices=choices,
+            default_value=default_dataset,
+            width=width,
+            callback=dataset_callback
+        )
+    
+        # Ratio selectors
+        if not lazy:
+            numerator_selector = build_numerator()
+            denominator_selector = build_denominator()
+        
+        if options_registry is not None:
+            key = f"datasets:{plot_label}"
+            options_registry.register(key, choices)
+            options_registry.bind(single_dataset_selector, key)
+            if not lazy:
+                options_registry.bind(numerator_selector, key)
+                options_registry.bind(denominator_selector, key)
+    
+    return DatasetSelectionGroup(mode_selector, single_dataset_selector, numerator_selector, denominator_selector)
+
+
+def release_selection_group(widgets: Tuple[Any, ...]) -> None:
+    """
+    Return the widgets of a discarded selection group to the widget pool.
+    
+    Args:
+        widgets: Tuple returned by create_dataset_selection_group or
+            create_coordinate_selection_group
+    """
+    for widget in widgets:
+        if isinstance(widget, LazySelect):
+            if widget.is_built:
+                release_widgets(widget.get())
+        else:
+            release_widgets(widget)
 
 
 def create_coordinate_selection_group(
@@ -193,7 +402,8 @@ def create_coordinate_selection_group(
     map_y_callback: Optional[Callable] = None,
     probe_x_callback: Optional[Callable] = None,
     probe_y_callback: Optional[Callable] = None,
-) -> Tuple[Select, Select, Select, Select]:
+    options_registry: Optional[OptionsRegistry] = None,
+) -> CoordinateSelectionGroup:
     """
     Create coordinate selectors for map and probe coordinates.
     
@@ -212,43 +422,65 @@ def create_coordinate_selection_group(
         map_y_callback: Callback for map Y change
         probe_x_callback: Callback for probe X change
         probe_y_callback: Callback for probe Y change
+        options_registry: Optional registry that keeps each options list in sync
+            across the selectors that share it
         
     Returns:
-        Tuple of (map_x_selector, map_y_selector, probe_x_selector, probe_y_selector)
+        CoordinateSelectionGroup of (map_x, map_y, probe_x, probe_y) selectors
     """
-    map_x_selector = create_coordinate_selector(
-        title=map_x_title,
-        choices=coord_choices or [],
-        default_value=default_map_x,
-        width=width,
-        callback=map_x_callback
-    )
+    # Selectors sharing a default share one options list instead of rebuilding it
+    choices = coord_choices or []
+    options_by_default: Dict[str, List[str]] = {}
     
-    map_y_selector = create_coordinate_selector(
-        title=map_y_title,
-        choices=coord_choices or [],
-        default_value=default_map_y,
-        width=width,
-        callback=map_y_callback
-    )
+    def options_for(default_value: str) -> List[str]:
+        options = options_by_default.get(default_value)
+        if options is None:
+            options = options_by_default[default_value] = _build_options(default_value, choices)
+        return options
     
-    probe_x_selector = create_coordinate_selector(
-        title=probe_x_title,
-        choices=coord_choices or [],
-        default_value=default_probe_x,
-        width=width,
-        callback=probe_x_callback
-    )
+    # Coalesce widget creation and callback attachment into one document patch
+    with hold_document(), batch_callbacks():
+        map_x_selector = create_select(
+            title=map_x_title,
+            value=default_map_x,
+            options=options_for(default_map_x),
+            width=width,
+            callback=map_x_callback
+        )
     
-    probe_y_selector = create_coordinate_selector(
-        title=probe_y_title,
-        choices=coord_choices or [],
-        default_value=default_probe_y,
-        width=width,
-        callback=probe_y_callback
-    )
+        map_y_selector = create_select(
+            title=map_y_title,
+            value=default_map_y,
+            options=options_for(default_map_y),
+            width=width,
+            callback=map_y_callback
+        )
+    
+        probe_x_selector = create_select(
+            title=probe_x_title,
+            value=default_probe_x,
+            options=options_for(default_probe_x),
+            width=width,
+            callback=probe_x_callback
+        )
+    
+        probe_y_selector = create_select(
+            title=probe_y_title,
+            value=default_probe_y,
+            options=options_for(default_probe_y),
+            width=width,
+            callback=probe_y_callback
+        )
+    
+        if options_registry is not None:
+            for default_value, options in options_by_default.items():
+                options_registry.register(f"coords:{default_value}", options)
+            options_registry.bind(map_x_selector, f"coords:{default_map_x}")
+            options_registry.bind(map_y_selector, f"coords:{default_map_y}")
+            options_registry.bind(probe_x_selector, f"coords:{default_probe_x}")
+            options_registry.bind(probe_y_selector, f"coords:{default_probe_y}")
     
-    return map_x_selector, map_y_selector, probe_x_selector, probe_y_selector
+    return CoordinateSelectionGroup(map_x_selector, map_y_selector, probe_x_selector, probe_y_selector)
 
 
 def create_optional_plot_toggle(
@@ -277,6 +509,7 @@ def create_optional_plot_toggle(
     )
 
 
+@lru_cache(maxsize=1024)
 def extract_dataset_path(selection_with_shape: str) -> str:
     """
     Extract just the dataset path from 'path (shape)' format.
@@ -287,7 +520,7 @@ def extract_dataset_path(selection_with_shape: str) -> str:
     Returns:
         Dataset path without shape info
     """
-    if selection_with_shape in ["No 2D datasets", "No 3D/4D datasets", "Use Default", "No datasets available"]:
+    if selection_with_shape in _SENTINELS:
         return selection_with_shape
     
     # Find the last occurrence of ' (' to separate path from shape
@@ -299,6 +532,7 @@ def extract_dataset_path(selection_with_shape: str) -> str:
         return selection_with_shape
 
 
+@lru_cache(maxsize=1024)
 def extract_shape(selection_with_shape: str) -> Optional[tuple]:
     """
     Extract shape tuple from 'path (shape1, shape2, ...)' format.
@@ -309,7 +543,7 @@ def extract_shape(selection_with_shape: str) -> Optional[tuple]:
     Returns:
         Shape tuple or None if not found
     """
-    if not selection_with_shape or selection_with_shape in ["No 2D datasets", "No 3D/4D datasets", "Use Default", "No datasets available"]:
+    if not selection_with_shape or selection_with_shape in _SENTINELS:
         return None
     
     last_paren = selection_with_shape.rfind(' (')
@@ -317,7 +551,8 @@ def extract_shape(selection_with_shape: str) -> Optional[tuple]:
         shape_str = selection_with_shape[last_paren+2:-1]  # Remove ' (' and ')'
         try:
             # Parse shape like "(100, 200)" or "(100, 200, 300)"
-            shape = tuple(int(x.strip()) for x in shape_str.split(','))
+            # int() tolerates surrounding whitespace, so no per-item strip is needed
+            shape = tuple(map(int, shape_str.split(',')))
             return shape
         except Exception:
             return None
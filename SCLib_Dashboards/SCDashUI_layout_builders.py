@@ -5,11 +5,85 @@ This module provides helper functions for building common dashboard layouts
 and organizing UI components into consistent structures.
 """
 
-from typing import List, Optional, Any, Dict, Tuple
-from bokeh.models import Div
+import html
+import warnings
+from functools import lru_cache, partial
+from typing import List, Optional, Any, Dict, Tuple, Union
+from bokeh.models import Button, Div, GridBox, InlineStyleSheet
 from bokeh.layouts import column, row
+from bokeh.io import curdoc
 
-from .SCDashUI_base_components import create_div, create_label_div, create_spacer
+from .SCDashUI_base_components import create_div, create_label_div, hold_document
+
+
+# Dashboard CSS, shipped with the styled models as InlineStyleSheets instead of
+# hidden <style> Divs that take part in layout. The rules target :host, the
+# shadow root of the model each sheet is attached to.
+_TOOLS_COLUMN_CSS = """
+:host {
+    border: 2px solid #ccc !important;
+    border-radius: 4px !important;
+    padding-left: 10px !important;
+    box-sizing: border-box !important;
+}
+"""
+
+_COLLAPSE_BUTTON_CSS = """
+:host {
+    position: relative;
+    z-index: 1000;
+    border-radius: 0 4px 4px 0;
+    margin: 5px 0;
+    margin-left: 0;
+}
+"""
+
+_PLOT_GRID_CSS = """
+:host {
+    border-left: 2px solid #ccc;
+    padding-left: 10px;
+}
+"""
+
+_PLOT_LABEL_CSS = """
+:host {
+    font-weight: bold;
+    font-size: 14px;
+    padding: 5px 0;
+    text-align: left;
+}
+"""
+
+
+def _current_document() -> Optional[Any]:
+    """Return curdoc(), or None if no document is available."""
+    try:
+        return curdoc()
+    except Exception:
+        return None
+
+
+def _server_document() -> Optional[Any]:
+    """
+    Return the current document if it belongs to a Bokeh server session.
+    
+    Deferred layout work is scheduled with add_next_tick_callback, which only
+    runs inside a server session; callers build eagerly when this is None.
+    """
+    doc = _current_document()
+    if doc is None or getattr(doc, "session_context", None) is None:
+        return None
+    return doc
+
+
+def _stylesheet(css: str) -> InlineStyleSheet:
+    """
+    Create a stylesheet for one layout model.
+    
+    A new model is built on every call: Bokeh models cannot be shared across
+    documents, so stylesheets are never cached at module level.
+    """
+    return InlineStyleSheet(css=css)
 
 
 def create_tools_column(
@@ -28,90 +102,49 @@ def create_tools_column(
         max_height: Optional maximum height in pixels (enables scrolling)
         
     Returns:
-        Column layout wrapped in a bordered container with left padding
-    """
-    from bokeh.layouts import column as bokeh_column, row as bokeh_row
-    
-    # Create the inner tools column
-    # Account for: 2px border on each side (4px total) + 10px left padding = 14px
-    inner_width = width - 14
-    inner_col = column(*items, width=inner_width, sizing_mode=sizing_mode)
-    if max_height:
-        inner_col.height = max_height
-        inner_col.sizing_mode = "fixed"
-    
-    # Create a left padding spacer (10px)
-    left_padding = create_spacer(width=10, height=1)
-    
-    # Create a row with left padding and the tools column
-    content_row = bokeh_row(left_padding, inner_col, sizing_mode="fixed")
-    content_row.width = width - 4  # Account for 2px border on each side
-    
-    # Create the final bordered wrapper column
-    # The content_row already has 10px left padding
-    # Now we need to add a border around it
-    wrapper_col = bokeh_column(content_row, sizing_mode="fixed", width=width)
-    
-    # Add border by using CSS classes
-    # Bokeh columns can have CSS classes applied
-    wrapper_col.css_classes = ["bordered-tools-wrapper"]
-    
-    # Create a style div that will inject CSS for the border
-    # This CSS will style the column with the border class
-    style_div = create_div(
-        text=f"""
-        <style>
-        .bordered-tools-wrapper {{
-            border: 2px solid #ccc !important;
-            border-radius: 4px !important;
-            padding-left: 0 !important;  /* Padding already in content_row */
-            box-sizing: border-box !important;
-        }}
-        </style>
-        """,
-        width=1,
-        height=1,
-        styles={"display": "none"}  # Hide the style div
+        Bordered column layout with left padding
+    """
+    # A single bordered column: the 2px border and 10px left padding come from the
+    # tools column stylesheet instead of wrapper rows/columns and a spacer Div
+    size_kwargs = (
+        {"sizing_mode": sizing_mode}
+        if max_height is None
+        else {"sizing_mode": "fixed", "height": max_height}
+    )
+    return column(
+        *items,
+        width=width,
+        css_classes=["bordered-tools-wrapper"],
+        stylesheets=[_stylesheet(_TOOLS_COLUMN_CSS)],
+        **size_kwargs,
     )
-    
-    # Create final wrapper with style and content
-    final_wrapper = bokeh_column(style_div, wrapper_col, sizing_mode="fixed", width=width)
-    
-    return final_wrapper
 
 
-def create_plot_column(
-    items: List[Any],
-    sizing_mode: str = "scale_width",
-) -> column:
-    """
-    Create a plot column layout.
+# Thin layout wrappers bound with partial to skip an extra Python call frame.
+# Both take a single list of children, e.g. create_plot_column([plot, controls]).
+create_plot_column = partial(column, sizing_mode="scale_width", spacing=0)  # Minimal spacing between widgets
+create_plot_column.__doc__ = """
+Create a plot column layout.
+
+Args:
+    items: List of widgets/components to include
+    sizing_mode: Sizing mode for the column (keyword only)
     
-    Args:
-        items: List of widgets/components to include
-        sizing_mode: Sizing mode for the column
-        
-    Returns:
-        Column layout
-    """
-    return column(*items, sizing_mode=sizing_mode, spacing=0)  # Minimal spacing between widgets
+Returns:
+    Column layout
+"""
 
+create_plots_row = partial(row, sizing_mode="stretch_both")
+create_plots_row.__doc__ = """
+Create a row of plot columns.
 
-def create_plots_row(
-    plot_columns: List[column],
-    sizing_mode: str = "stretch_both",
-) -> row:
-    """
-    Create a row of plot columns.
+Args:
+    plot_columns: List of plot column layouts
+    sizing_mode: Sizing mode for the row (keyword only)
     
-    Args:
-        plot_columns: List of plot column layouts
-        sizing_mode: Sizing mode for the row
-        
-    Returns:
-        Row layout
-    """
-    return row(*plot_columns, sizing_mode=sizing_mode)
+Returns:
+    Row layout
+"""
 
 
 def create_dashboard_layout(
@@ -119,7 +152,7 @@ def create_dashboard_layout(
     plots_row: row,
     status_display: Optional[Div] = None,
     sizing_mode: str = "stretch_width",
-) -> column:
+) -> GridBox:
     """
     Create the main dashboard layout.
     
@@ -130,16 +163,16 @@ def create_dashboard_layout(
         sizing_mode: Sizing mode for the main layout
         
     Returns:
-        Main dashboard column layout
+        Main dashboard grid layout
     """
-    items = [
-        row(tools_column, plots_row, sizing_mode=sizing_mode)
-    ]
+    # Single flat grid instead of column(row(tools, plots), status):
+    # tools | plots on the first row, status spanning both columns below
+    children = [(tools_column, 0, 0), (plots_row, 0, 1)]
     
     if status_display:
-        items.append(status_display)
+        children.append((status_display, 1, 0, 1, 2))
     
-    return column(*items)
+    return GridBox(children=children, sizing_mode=sizing_mode)
 
 
 def create_section(
@@ -158,9 +191,7 @@ def create_section(
     Returns:
         Column layout with title and items
     """
-    section_items = [create_label_div(title, width=width)]
-    section_items.extend(items)
-    return column(*section_items)
+    return column(create_label_div(title, width=width), *items)
 
 
 def create_button_row(
@@ -179,10 +210,14 @@ def create_button_row(
     Returns:
         Row layout
     """
-    items = list(buttons)
     if status_div:
-        items.append(status_div)
-    return row(*items, sizing_mode=sizing_mode)
+        return row(*buttons, status_div, sizing_mode=sizing_mode)
+    return row(*buttons, sizing_mode=sizing_mode)
+
+
+# Shared constructor arguments for range sections (minimal spacing between widgets)
+_RANGE_ROW_KWARGS = {"spacing": 0}
+_RANGE_SECTION_KWARGS = {"sizing_mode": "stretch_width", "spacing": 0}
 
 
 def create_range_section_layout(
@@ -203,16 +238,13 @@ def create_range_section_layout(
     Returns:
         Column layout
     """
-    #items = [create_label_div(label, width=width)]
-    items = []
-
-    if toggle:
-        items.append(toggle)
-    
+    # label and width are kept for API compatibility; the label is not rendered
     min_input, max_input = range_inputs
-    items.append(row(min_input, max_input, spacing=0))  # Minimal spacing between min and max inputs
+    range_row = row(min_input, max_input, **_RANGE_ROW_KWARGS)
     
-    return column(*items, sizing_mode="stretch_width", spacing=0)  # Minimal spacing between widgets
+    if toggle:
+        return column(toggle, range_row, **_RANGE_SECTION_KWARGS)
+    return column(range_row, **_RANGE_SECTION_KWARGS)
 
 
 def create_plot_with_controls(
@@ -231,9 +263,7 @@ def create_plot_with_controls(
     Returns:
         Column layout with controls and plot
     """
-    items = list(controls)
-    items.append(plot)
-    return column(*items, sizing_mode=sizing_mode)
+    return column(*controls, plot, sizing_mode=sizing_mode)
 
 
 def create_plot_with_controls_and_buttons(
@@ -256,42 +286,73 @@ def create_plot_with_controls_and_buttons(
     Returns:
         Column layout
     """
-    items = list(controls)
-    items.append(plot)
-    
     button_row = create_button_row(buttons, status_div)
-    items.append(button_row)
-    
-    return column(*items, sizing_mode=sizing_mode)
+    return column(*controls, plot, button_row, sizing_mode=sizing_mode)
 
 
 def create_aligned_plot_columns(
     plot1_column: column,
     plot2_column: column,
     plot3_column: Optional[column] = None,
-    spacer_height: int = 70,
+    spacer_height: Optional[int] = None,
 ) -> List[column]:
     """
-    Create aligned plot columns with spacers for consistent alignment.
+    Collect plot columns into a list, skipping the optional third column.
     
     Args:
         plot1_column: First plot column
         plot2_column: Second plot column
         plot3_column: Optional third plot column
-        spacer_height: Height for alignment spacers
+        spacer_height: Deprecated and ignored; no alignment spacers are added
         
     Returns:
-        List of aligned plot columns
+        List of plot columns
     """
-    columns = [plot1_column]
-    
-    if plot3_column:
-        columns.append(plot2_column)
-        columns.append(plot3_column)
-    else:
-        columns.append(plot2_column)
+    if spacer_height is not None:
+        warnings.warn(
+            "create_aligned_plot_columns() ignores spacer_height; the argument will be removed",
+            DeprecationWarning,
+            stacklevel=2,
+        )
     
-    return columns
+    return [c for c in (plot1_column, plot2_column, plot3_column) if c is not None]
+
+
+@lru_cache(maxsize=64)
+def _datasets_html(datasets_info: Tuple[str, ...]) -> str:
+    """HTML list of selected datasets (empty string if there are none)."""
+    if not datasets_info:
+        return ""
+    items = "".join(f"<li>{html.escape(info)}</li>" for info in datasets_info)
+    return f"<p><b>Selected Datasets:</b></p><ul>{items}</ul>"
+
+
+@lru_cache(maxsize=64)
+def _instructions_html(instructions: Optional[str]) -> str:
+    """HTML instructions block (empty string if there are none)."""
+    return f"<p><b>Instructions:</b></p>{instructions}" if instructions else ""
+
+
+@lru_cache(maxsize=64)
+def _content_html(content: str) -> str:
+    """HTML content paragraph (empty string if there is no content)."""
+    return f"<p>{content}</p>" if content else ""
+
+
+@lru_cache(maxsize=64)
+def _build_status_html(
+    title: str,
+    datasets_info: Tuple[str, ...],
+    instructions: Optional[str],
+    content: str,
+) -> str:
+    """Build (and memoize) the HTML body of a status display."""
+    return (
+        f"<h3>{title}</h3>"
+        f"{_datasets_html(datasets_info)}"
+        f"{_instructions_html(instructions)}"
+        f"{_content_html(content)}"
+    )
 
 
 def create_status_display(
@@ -308,27 +369,19 @@ def create_status_display(
         title: Display title
         content: Additional content
         width: Widget width
-        datasets_info: Optional list of dataset information strings
+        datasets_info: Optional list of dataset information strings (plain text, HTML-escaped)
         instructions: Optional instructions text
         
     Returns:
         Div widget with formatted status display
     """
-    html_parts = [f"<h3>{title}</h3>"]
-    
-    if datasets_info:
-        html_parts.append("<p><b>Selected Datasets:</b></p><ul>")
-        for info in datasets_info:
-            html_parts.append(f"<li>{info}</li>")
-        html_parts.append("</ul>")
-    
-    if instructions:
-        html_parts.append(f"<p><b>Instructions:</b></p>{instructions}")
-    
-    if content:
-        html_parts.append(f"<p>{content}</p>")
-    
-    return create_div(text="".join(html_parts), width=width)
+    html_text = _build_status_html(
+        title,
+        tuple(datasets_info) if datasets_info else (),
+        instructions,
+        content,
+    )
+    return create_div(text=html_text, width=width)
 
 
 def create_initialization_layout(
@@ -337,6 +390,7 @@ def create_initialization_layout(
     plot2_section: column,
     initialize_button: Any,
     status_display: Optional[Div] = None,
+    default_status_height: Optional[int] = 200,
 ) -> column:
     """
     Create the initial dataset selection layout.
@@ -347,34 +401,36 @@ def create_initialization_layout(
         plot2_section: Plot2 configuration section
         initialize_button: Initialize button widget
         status_display: Optional status display
+        default_status_height: Height given to a status display without one;
+            None leaves the status display untouched
         
     Returns:
         Column layout for initialization
     """
-    # Create main content row - constrain it to prevent taking all vertical space
-    main_content = row(plot1_section, plot2_section, sizing_mode="stretch_width")
+    # Coalesce the layout construction into one document patch
+    with hold_document():
+        # Create main content row - constrain it to prevent taking all vertical space
+        main_content = row(plot1_section, plot2_section, sizing_mode="stretch_width")
     
-    # Build items list - ensure proper vertical stacking
-    items = [
-        create_div(text=f"<h2>{title}</h2>"),
-        main_content
-    ]
+        # Build items list - ensure proper vertical stacking
+        items = [
+            create_div(text=f"<h2>{title}</h2>"),
+            main_content
+        ]
     
-    # Add status display at the bottom, outside the main content row
-    # This ensures it doesn't overlap with plot sections
-    if status_display:
-        items.append(create_div(text="<hr>", width=800))  # Separator
-        # Add status display directly - don't wrap in extra container
-        # Set explicit height to prevent it from expanding
-        if hasattr(status_display, 'height') and status_display.height:
-            pass  # Already has height
-        else:
-            status_display.height = 200  # Set a reasonable height
-        items.append(status_display)
+        # Add status display at the bottom, outside the main content row
+        # This ensures it doesn't overlap with plot sections
+        if status_display:
+            items.append(create_div(text="<hr>", width=800))  # Separator
+            # Add status display directly - don't wrap in extra container
+            # Set explicit height to prevent it from expanding
+            if default_status_height is not None:
+                status_display.height = status_display.height or default_status_height
+            items.append(status_display)
     
-    # Use "fixed" sizing mode to ensure items stack vertically without overlap
-    # This prevents items from trying to fill all available space
-    return column(*items, sizing_mode="fixed")
+        # Use "fixed" sizing mode to ensure items stack vertically without overlap
+        # This prevents items from trying to fill all available space
+        return column(*items, sizing_mode="fixed")
 
 
 def create_plot_with_controls_side_by_side(
@@ -392,22 +448,26 @@ def create_plot_with_controls_side_by_side(
         controls_column: Column of control widgets (Min, Max, dynamic/userselected, Linear/Log)
         controls_width: Width of the controls column
         sizing_mode: Sizing mode for the row
-        plot_label: Optional label text to display above the entire row (controls + plot)
+        plot_label: Optional label text (plain text, HTML-escaped) to display above the entire row (controls + plot)
         
     Returns:
         Column layout with label (if provided), then row with controls on left, plot on right
     """
-    # Set width for controls column - keep it fixed width
-    controls_column.width = controls_width
-    controls_column.sizing_mode = "fixed"
+    # Set width for controls column - keep it fixed width (only touch properties that differ)
+    if controls_column.width != controls_width:
+        controls_column.width = controls_width
+    if controls_column.sizing_mode != "fixed":
+        controls_column.sizing_mode = "fixed"
     
     # Create the row with controls and plot
     plot_row = row(controls_column, plot, sizing_mode="scale_width")
     
     # If label is provided, add it above the entire row (spanning controls + plot)
     if plot_label:
-        label_div = create_div(
-            text=f"<div style='font-weight: bold; font-size: 14px; padding: 5px 0; text-align: left;'>{plot_label}</div>"
+        label_div = Div(
+            text=html.escape(plot_label),
+            css_classes=["plot-label"],
+            stylesheets=[_stylesheet(_PLOT_LABEL_CSS)],
         )
         # Create column with label and plot row
         result_column = column(label_div, plot_row, sizing_mode="stretch_width")
@@ -434,10 +494,13 @@ def create_collapsible_tools_column(
     Returns:
         Tuple of (column layout with toggle, toggle button)
     """
-    from bokeh.models import Button
-    
     # Create the tools column
-    tools_col = column(*items, width=width if not initial_collapsed else collapsed_width, sizing_mode="fixed")
+    tools_col = column(
+        *items,
+        width=width if not initial_collapsed else collapsed_width,
+        sizing_mode="fixed",
+        visible=not initial_collapsed,
+    )
     
     # Create toggle button
     toggle_button = Button(label="◀" if not initial_collapsed else "▶", width=30, height=30)
@@ -446,21 +509,21 @@ def create_collapsible_tools_column(
     state = {"is_collapsed": initial_collapsed}
     
     def toggle_callback():
-        state["is_collapsed"] = not state["is_collapsed"]
-        if state["is_collapsed"]:
-            tools_col.width = collapsed_width
-            toggle_button.label = "▶"
-            # Hide all items except the button
-            for item in items:
-                if hasattr(item, 'visible'):
-                    item.visible = False
-        else:
-            tools_col.width = width
-            toggle_button.label = "◀"
-            # Show all items
-            for item in items:
-                if hasattr(item, 'visible'):
-                    item.visible = True
+        collapse = not state["is_collapsed"]
+        # Nothing to do if the tools column already shows the requested state
+        if tools_col.visible == (not collapse):
+            return
+        state["is_collapsed"] = collapse
+        # Hiding the parent column hides every item in one change, without
+        # flipping each child's visibility
+        with hold_document("combine"):
+            tools_col.visible = not state["is_collapsed"]
+            if state["is_collapsed"]:
+                tools_col.width = collapsed_width
+                toggle_button.label = "▶"
+            else:
+                tools_col.width = width
+                toggle_button.label = "◀"
     
     toggle_button.on_click(toggle_callback)
     
@@ -470,6 +533,22 @@ def create_collapsible_tools_column(
     return tools_col_with_toggle, toggle_button
 
 
+# Labels shown above each plot in the optimized dashboard layout
+_PLOT1A_LABEL = "Projection -- file"
+_PLOT2A_LABEL = "Probe 1"
+_PLOT3_LABEL = "Projection -- generated"
+_PLOT2B_LABEL = "Probe 2"
+
+# Header shown above the collapsible tools panel
+_TOOLS_PANEL_HEADER_HTML = (
+    "<div style='padding: 3px; background-color: #f0f0f0; border-bottom: 1px solid #ccc;'>"
+    "<b>Tools Panel</b></div>"
+)
+
+# Approximate height of a slider row when no explicit height is set
+_DEFAULT_SLIDER_HEIGHT = 50
+
+
 def create_optimized_dashboard_layout(
     tools_column: column,
     plot1a_controls: column,
@@ -487,7 +566,10 @@ def create_optimized_dashboard_layout(
     tools_width: int = 260, #was 400
     controls_width: int = 200,
     sizing_mode: str = "stretch_both",
-) -> column:
+    lazy_second_row: bool = False,
+    split_roots: bool = False,
+    defer_toggle: bool = False,
+) -> Union[column, List[Any]]:
     """
     Create the optimized dashboard layout with two columns:
     - Tools column (collapsible) on the left
@@ -514,12 +596,18 @@ def create_optimized_dashboard_layout(
         tools_width: Width of tools column when expanded
         controls_width: Width of controls column for each plot
         sizing_mode: Sizing mode for the main layout
+        lazy_second_row: If True and running in a Bokeh server session, the
+            Plot3 | Plot2b row is built on the next tick after the first paint
+        split_roots: If True, return the top-level pieces (toggle header, main
+            row, optional status display) as a list for add_dashboard_roots()
+            instead of wrapping them in a single column
+        defer_toggle: If True and running in a Bokeh server session, the collapse
+            button and tools panel header are added on the next tick after the
+            first paint
         
     Returns:
-        Main dashboard column layout
+        Main dashboard column layout, or a list of root layouts if split_roots is set
     """
-    from bokeh.models import Button
-    
     # Make tools column collapsible
     # Store the original width
     original_width = tools_column.width if hasattr(tools_column, 'width') else tools_width
@@ -534,40 +622,20 @@ def create_optimized_dashboard_layout(
         width=30,
         height=30,
         button_type="default",
-        css_classes=["collapse-btn", "left"]
+        css_classes=["collapse-btn", "left"],
+        stylesheets=[_stylesheet(_COLLAPSE_BUTTON_CSS)],
     )
     
     # Create header div for the tools panel
     header_div = create_div(
-        text="""<div style='padding: 3px; background-color: #f0f0f0; border-bottom: 1px solid #ccc;  .collapse-btn {
-            position: relative;
-            z-index: 1000;
-            border-radius: 0 4px 4px 0;
-            margin: 5px 0;
-        }
-        .collapse-btn.left {
-            margin-left: 0;
-        }'><b>Tools Panel</b></div>""",
+        text=_TOOLS_PANEL_HEADER_HTML,
         width=original_width
     )
-    #   # Add CSS styling for the collapse button (similar to the example)
-    # css_style = create_div(text="""
-    #     <style>
-    #     .collapse-btn {
-    #         position: relative;
-    #         z-index: 1000;
-    #         border-radius: 0 4px 4px 0;
-    #         margin: 5px 0;
-    #     }
-    #     .collapse-btn.left {
-    #         margin-left: 0;
-    #     }
-    #     </style>
-    # """)
     # Create toggle container - when collapsed, this will be narrow with just the button
+    # With defer_toggle, the button and header are patched in after the first paint
+    toggle_doc = _server_document() if defer_toggle else None
     toggle_container = column(
-        row(toggle_button,  
-        header_div),
+        *([] if toggle_doc is not None else [row(toggle_button, header_div)]),
         sizing_mode="fixed",
         width=original_width,
         margin=(0, 0, 0, 0)  # No margin so button is flush with left edge
@@ -577,37 +645,43 @@ def create_optimized_dashboard_layout(
     state = {"is_collapsed": False}
     
     def toggle_callback():
-        state["is_collapsed"] = not state["is_collapsed"]
-        if state["is_collapsed"]:
-            # Collapse: hide tools column content, keep only button visible
-            tools_column.visible = False  # Hide the entire tools column content
-            header_div.visible = False  # Hide header when collapsed
-            toggle_button.label = "▶"
-            toggle_button.width = button_width
-            # Set container widths to button width so plot column expands
-            toggle_container.width = button_width
-            tools_col_with_toggle.width = button_width
-            # Make sure toggle container only shows button
-            toggle_container.visible = True
-        else:
-            # Expand: restore original width
-            tools_column.visible = True  # Show the tools column content
-            header_div.visible = True  # Show header when expanded
-            toggle_button.label = "◀"
-            toggle_button.width = button_width
-            # Restore full width
-            toggle_container.width = original_width
-            tools_col_with_toggle.width = original_width
-            tools_column.width = original_width
-            # Show all children
-            for child in toggle_container.children:
-                if hasattr(child, 'visible'):
-                    child.visible = True
-            for child in tools_column.children:
-                if hasattr(child, 'visible'):
-                    child.visible = True
-    
-    toggle_button.on_click(toggle_callback)
+        collapse = not state["is_collapsed"]
+        # Nothing to do if the tools column already shows the requested state
+        if tools_column.visible == (not collapse):
+            return
+        state["is_collapsed"] = collapse
+        # Ship all property changes as one patch and one layout pass
+        with hold_document("combine"):
+            if state["is_collapsed"]:
+                # Collapse: hide tools column content, keep only button visible
+                tools_column.visible = False  # Hide the entire tools column content
+                header_div.visible = False  # Hide header when collapsed
+                toggle_button.label = "▶"
+                toggle_button.width = button_width
+                # Set container widths to button width so plot column expands
+                toggle_container.width = button_width
+                tools_col_with_toggle.width = button_width
+                # Make sure toggle container only shows button
+                toggle_container.visible = True
+            else:
+                # Expand: restore original width
+                tools_column.visible = True  # Show the tools column content
+                header_div.visible = True  # Show header when expanded
+                toggle_button.label = "◀"
+                toggle_button.width = button_width
+                # Restore full width
+                toggle_container.width = original_width
+                tools_col_with_toggle.width = original_width
+                tools_column.width = original_width
+    
+    if toggle_doc is not None:
+        def attach_toggle():
+            toggle_container.children = [row(toggle_button, header_div)]
+            toggle_button.on_click(toggle_callback)
+        
+        toggle_doc.add_next_tick_callback(attach_toggle)
+    else:
+        toggle_button.on_click(toggle_callback)
     
     # Create column with toggle button and tools
     # When collapsed, this will be just the button width
@@ -625,35 +699,27 @@ def create_optimized_dashboard_layout(
         plot1a_controls,
         controls_width=controls_width,
         sizing_mode="stretch_both",
-        plot_label="Projection -- file"
+        plot_label=_PLOT1A_LABEL
     )
     
     # Add sliders above Plot1a if provided
-    # Calculate spacer height to match sliders (slider height is typically ~50px)
-    slider_spacer_height = 50  # Approximate height of slider row
+    # The spacer height aligns Plot2a/Plot2b with the sliders above Plot1a
     if sliders_column is not None:
         plot1a_row = column(sliders_column, plot1a_with_controls, sizing_mode="stretch_width")
-        # Try to get actual height from sliders_column if available
-        if hasattr(sliders_column, 'height') and sliders_column.height:
-            slider_spacer_height = sliders_column.height
-        elif hasattr(sliders_column, 'children') and len(sliders_column.children) > 0:
-            # Check if first child (sliders_row) has a height
-            first_child = sliders_column.children[0]
-            if hasattr(first_child, 'height') and first_child.height:
-                slider_spacer_height = first_child.height
+        # Prefer the column's own height, then its first child's (the sliders row)
+        children = getattr(sliders_column, 'children', None) or []
+        first_child_height = getattr(children[0], 'height', None) if children else None
+        slider_spacer_height = (
+            getattr(sliders_column, 'height', None) or first_child_height or _DEFAULT_SLIDER_HEIGHT
+        )
     else:
         # Fallback to individual sliders if sliders_column not provided
-        slider_row_items = []
-        if x_slider:
-            slider_row_items.append(x_slider)
-        if y_slider:
-            slider_row_items.append(y_slider)
+        slider_row_items = [s for s in (x_slider, y_slider) if s]
         if slider_row_items:
             slider_row = row(*slider_row_items, sizing_mode="stretch_width")
             plot1a_row = column(slider_row, plot1a_with_controls, sizing_mode="stretch_width")
-            # Try to get height from slider
-            if x_slider and hasattr(x_slider, 'height') and x_slider.height:
-                slider_spacer_height = x_slider.height
+            x_slider_height = getattr(x_slider, 'height', None) if x_slider else None
+            slider_spacer_height = x_slider_height or _DEFAULT_SLIDER_HEIGHT
         else:
             plot1a_row = plot1a_with_controls
             slider_spacer_height = 0  # No sliders, no spacer needed
@@ -663,83 +729,97 @@ def create_optimized_dashboard_layout(
         plot2a_controls,
         controls_width=controls_width,
         sizing_mode="stretch_both",
-        plot_label="Probe 1"
+        plot_label=_PLOT2A_LABEL
     )
     
-    # Add spacer above Plot2a to align with sliders above Plot1a
+    # Offset Plot2a with a top margin to align with sliders above Plot1a
     if slider_spacer_height > 0:
-        plot2a_spacer = create_spacer(height=slider_spacer_height)
-        plot2a_row = column(plot2a_spacer, plot2a_with_controls, sizing_mode="stretch_width")
-    else:
-        plot2a_row = plot2a_with_controls
-    
-    plot3_row = create_plot_with_controls_side_by_side(
-        plot3_plot,
-        plot3_controls,
-        controls_width=controls_width,
-        sizing_mode="stretch_both",
-        plot_label="Projection -- generated"
-    )
+        plot2a_with_controls.margin = (slider_spacer_height, 0, 0, 0)
+    plot2a_row = plot2a_with_controls
     
-    # Create Plot1a | Plot2a row
-    # Use stretch_width for horizontal expansion, but maintain aspect ratio
-    plots_row_1 = row(plot1a_row, plot2a_row, sizing_mode="stretch_width")
-    
-    # Create Plot3 | Plot2b row
-    plot2b_row = None
-    if plot2b_controls and plot2b_plot:
-        plot2b_with_controls = create_plot_with_controls_side_by_side(
-            plot2b_plot,
-            plot2b_controls,
+    def build_second_row_cells():
+        plot3_row = create_plot_with_controls_side_by_side(
+            plot3_plot,
+            plot3_controls,
             controls_width=controls_width,
             sizing_mode="stretch_both",
-            plot_label="Probe 2"
+            plot_label=_PLOT3_LABEL
         )
-        # Add spacer above Plot2b to align with sliders above Plot1a
-        if slider_spacer_height > 0:
-            plot2b_spacer = create_spacer(height=slider_spacer_height)
-            plot2b_row = column(plot2b_spacer, plot2b_with_controls, sizing_mode="stretch_width")
-        else:
-            plot2b_row = plot2b_with_controls
-        plots_row_2 = row(plot3_row, plot2b_row, sizing_mode="stretch_width")
-    else:
+        
+        # Plot3 | Plot2b cells
+        if plot2b_controls and plot2b_plot:
+            plot2b_with_controls = create_plot_with_controls_side_by_side(
+                plot2b_plot,
+                plot2b_controls,
+                controls_width=controls_width,
+                sizing_mode="stretch_both",
+                plot_label=_PLOT2B_LABEL
+            )
+            # Offset Plot2b with a top margin to align with sliders above Plot1a
+            if slider_spacer_height > 0:
+                plot2b_with_controls.margin = (slider_spacer_height, 0, 0, 0)
+            return [plot3_row, plot2b_with_controls]
         # If Plot2b doesn't exist, just show Plot3
-        plots_row_2 = row(plot3_row, sizing_mode="stretch_width")
+        return [plot3_row]
     
-    # Create plot column - use stretch_width for horizontal expansion, but maintain vertical space
-    plot_column = column(
-        plots_row_1,
-        plots_row_2,
-        sizing_mode="stretch_width"  # Only stretch horizontally, maintain vertical space
-    )
-    # Create a simple vertical line divider between tools and plot columns
-    divider_line = create_div(
-        text="",
-        width=2,
-        styles={
-            "background-color": "#ccc",
-            "width": "2px",
-            "min-height": "100%",
-            "margin-right": "10px",
-        }
+    # Place the 2x2 plot grid in a single CSS-grid GridBox instead of a column of rows
+    grid_children = [(plot1a_row, 0, 0), (plot2a_row, 0, 1)]
+    
+    doc = _server_document() if lazy_second_row else None
+    if doc is not None:
+        plots_row_2 = column(name="plots_row_2_placeholder", sizing_mode="stretch_width")
+        grid_children.append((plots_row_2, 1, 0, 1, 2))
+        
+        def reveal_plots_row_2():
+            plots_row_2.children = [row(*build_second_row_cells(), sizing_mode="stretch_width")]
+        
+        doc.add_next_tick_callback(reveal_plots_row_2)
+    else:
+        grid_children.extend((cell, 1, col) for col, cell in enumerate(build_second_row_cells()))
+    
+    # Only stretch horizontally, maintain vertical space
+    # The vertical divider between tools and plots is the grid's left border (_PLOT_GRID_CSS)
+    plot_column = GridBox(
+        children=grid_children,
+        sizing_mode="stretch_width",
+        css_classes=["plot-grid"],
+        stylesheets=[_stylesheet(_PLOT_GRID_CSS)],
     )
     
-    # Create main layout: Tools column | Divider line | Plot column
+    # Create main layout: Tools column | Plot column
     # Use scale_width so plot column expands horizontally when tools column collapses
     # But don't affect vertical sizing - plots should maintain their height
-    main_row = row(tools_col_with_toggle, divider_line, plot_column, sizing_mode="scale_width")
+    main_row = row(tools_col_with_toggle, plot_column, sizing_mode="scale_width")
     
     # Add status display if provided
     items = [main_row]
     if status_display:
         items.append(status_display)
     
+    if split_roots:
+        return [toggle_container, *items]
+    
     # Create main container with CSS for the collapse button
     main_container = column(*items, sizing_mode="stretch_width")
     
+    return column(toggle_container, main_container, sizing_mode="stretch_width")
+
 
+def add_dashboard_roots(layouts: Union[Any, List[Any]], doc: Optional[Any] = None) -> None:
+    """
+    Add a dashboard to a document as one or more separate roots.
     
-    return column(toggle_container, main_container, sizing_mode="stretch_width")
+    Bokeh solves the layout of each root independently, so a dashboard built
+    with create_optimized_dashboard_layout(..., split_roots=True) is laid out
+    as several smaller trees instead of one large one.
+    
+    Args:
+        layouts: A single layout or a list of root layouts
+        doc: Target document (defaults to curdoc())
+    """
+    doc = doc if doc is not None else curdoc()
+    for layout in (layouts if isinstance(layouts, list) else [layouts]):
+        doc.add_root(layout)
 
 
 def create_header_banner(dataset_name: str = "", dashboard_type: str = "Dashboard") -> Div:
@@ -753,8 +833,6 @@ def create_header_banner(dataset_name: str = "", dashboard_type: str = "Dashboar
     Returns:
         Div widget containing the header banner
     """
-    from bokeh.models import Div
-    
     # ScientistCloud primary color
     sc_blue = "#4E477F"
     
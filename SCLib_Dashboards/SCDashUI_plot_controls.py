@@ -9,7 +9,7 @@ This module provides UI components for controlling plot properties:
 - Range mode toggles
 """
 
-from typing import Optional, Callable, Tuple, List
+from typing import Optional, Callable, Tuple, List, NamedTuple
 from bokeh.models import TextInput, RadioButtonGroup, Select, Toggle, Div
 from bokeh.layouts import column, row
 
@@ -20,14 +20,20 @@ from .SCDashUI_base_components import (
     create_toggle,
     create_label_div,
     create_div,
+    hold_document,
 )
 
 
-# Color palettes
+# Color palettes (the set gives O(1) membership checks for selector values)
 DEFAULT_PALETTES = [
     "Viridis256", "Plasma256", "Inferno256", "Magma256",
     "Cividis256", "Turbo256", "Greys256", "Blues256"
 ]
+DEFAULT_PALETTES_SET = frozenset(DEFAULT_PALETTES)
+
+# Default color scale labels. Kept as a list (Bokeh's List properties reject tuples);
+# Bokeh copies list values on assignment, so sharing one instance is safe.
+_DEFAULT_SCALE_LABELS = ["Linear", "Log"]
 
 
 def create_range_inputs(
@@ -38,6 +44,7 @@ def create_range_inputs(
     width: int = 120,
     min_callback: Optional[Callable] = None,
     max_callback: Optional[Callable] = None,
+    live_callback: Optional[Callable] = None,
 ) -> Tuple[TextInput, TextInput]:
     """
     Create a pair of range input widgets (min and max).
@@ -48,8 +55,10 @@ def create_range_inputs(
         min_value: Default minimum value
         max_value: Default maximum value
         width: Widget width in pixels
-        min_callback: Optional callback for min input
-        max_callback: Optional callback for max input
+        min_callback: Optional callback for min input (on committed "value")
+        max_callback: Optional callback for max input (on committed "value")
+        live_callback: Optional debounced callback bound to "value_input" on both
+            inputs for live feedback while typing
         
     Returns:
         Tuple of (min_input, max_input) widgets
@@ -58,14 +67,16 @@ def create_range_inputs(
         title=min_title,
         value=str(min_value) if min_value is not None else "",
         width=width,
-        callback=min_callback
+        callback=min_callback,
+        live_callback=live_callback,
     )
     
     max_input = create_text_input(
         title=max_title,
         value=str(max_value) if max_value is not None else "",
         width=width,
-        callback=max_callback
+        callback=max_callback,
+        live_callback=live_callback,
     )
     
     return min_input, max_input
@@ -133,11 +144,8 @@ def create_color_scale_selector(
     Returns:
         RadioButtonGroup widget
     """
-    if labels is None:
-        labels = ["Linear", "Log"]
-    
     return create_radio_button_group(
-        labels=labels,
+        labels=labels if labels is not None else _DEFAULT_SCALE_LABELS,
         active=active,
         width=width,
         callback=callback
@@ -192,13 +200,10 @@ def create_palette_selector(
     Returns:
         Select widget
     """
-    if palettes is None:
-        palettes = DEFAULT_PALETTES
-    
     return create_select(
         title="Color Palette:",
         value=value,
-        options=palettes,
+        options=palettes if palettes is not None else DEFAULT_PALETTES,
         width=width,
         callback=callback
     )
@@ -234,6 +239,19 @@ def create_palette_section(
     )
 
 
+class ShapeControls(NamedTuple):
+    """Widgets returned by create_plot_shape_controls (unpacks like a 9-tuple)."""
+    shape_selector: RadioButtonGroup
+    custom_width_input: TextInput
+    custom_height_input: TextInput
+    scale_input: TextInput
+    min_size_input: TextInput
+    max_size_input: TextInput
+    custom_controls: column
+    aspect_controls: column
+    size_limits_controls: column
+
+
 def create_plot_shape_controls(
     active: int = 0,  # 0=Square, 1=Custom, 2=Aspect Ratio
     width: int = 200,
@@ -248,7 +266,7 @@ def create_plot_shape_controls(
     max_size: int = 400,
     min_size_callback: Optional[Callable] = None,
     max_size_callback: Optional[Callable] = None,
-) -> Tuple[RadioButtonGroup, TextInput, TextInput, TextInput, TextInput, TextInput, column, column, column]:
+) -> "ShapeControls":
     """
     Create plot shape control widgets.
     
@@ -268,8 +286,9 @@ def create_plot_shape_controls(
         max_size_callback: Callback for max size change
         
     Returns:
-        Tuple of (shape_selector, custom_width_input, custom_height_input, scale_input,
-                 min_size_input, max_size_input, custom_controls, aspect_controls, size_limits_controls)
+        ShapeControls (unpacks like the 9-tuple (shape_selector, custom_width_input,
+        custom_height_input, scale_input, min_size_input, max_size_input,
+        custom_controls, aspect_controls, size_limits_controls))
     """
     # Shape mode selector
     shape_selector = create_radio_button_group(
@@ -333,7 +352,7 @@ def create_plot_shape_controls(
         row(min_size_input, max_size_input),
     )
     
-    return (
+    return ShapeControls(
         shape_selector,
         custom_width_input,
         custom_height_input,
@@ -435,10 +454,8 @@ def update_range_inputs_safely(
     """
     Safely update range input widgets while preserving their disabled state.
     
-    This function handles the common pattern of:
-    1. Temporarily enabling disabled inputs
-    2. Updating the values
-    3. Restoring the disabled state
+    Values are written directly (also on disabled inputs) inside a single
+    document hold, so the disabled state is never toggled.
     
     Args:
         min_input: Minimum range input widget (can be None)
@@ -466,26 +483,19 @@ def update_range_inputs_safely(
         )
     """
     def _update():
-        try:
-            if min_input is not None:
-                was_disabled = min_input.disabled
-                if was_disabled:
-                    min_input.disabled = False
-                min_input.value = str(min_value)
-                if was_disabled:
-                    min_input.disabled = True
-            
-            if max_input is not None:
-                was_disabled = max_input.disabled
-                if was_disabled:
-                    max_input.disabled = False
-                max_input.value = str(max_value)
-                if was_disabled:
-                    max_input.disabled = True
-        except Exception as e:
-            print(f"⚠️ WARNING: Failed to update range inputs: {e}")
-            import traceback
-            traceback.print_exc()
+        # Coalesce the widget writes into one document patch
+        with hold_document():
+            try:
+                # Bokeh accepts value writes on disabled inputs, so the disabled
+                # state is left alone
+                if min_input is not None:
+                    min_input.value = str(min_value)
+                if max_input is not None:
+                    max_input.value = str(max_value)
+            except Exception as e:
+                print(f"⚠️ WARNING: Failed to update range inputs: {e}")
+                import traceback
+                traceback.print_exc()
     
     if use_callback:
         return _update
@@ -5,12 +5,62 @@ This module provides utilities for synchronizing UI widget states with
 plot objects and processor objects, enabling bidirectional updates.
 """
 
-from typing import Optional, Callable, Any, Dict, List
-import numpy as np
+from typing import Optional, Callable, Any, Dict, List, Union
+from bokeh.io import curdoc
 
-from .SCDash_base_plot import BasePlot, RangeMode, ColorScale, PlotShapeMode
-from .SCDashUI_plot_controls import create_range_inputs, create_color_scale_selector, create_palette_selector
-from .SCDashUI_base_components import create_text_input, create_select, create_radio_button_group
+from .SCDash_base_plot import BasePlot, RangeMode, ColorScale, PlotShapeMode, cached_percentile_range
+from .SCDashUI_plot_controls import (
+    create_range_inputs,
+    create_color_scale_selector,
+    create_palette_selector,
+    ShapeControls,
+    DEFAULT_PALETTES_SET,
+)
+from .SCDashUI_base_components import create_select, create_radio_button_group, hold_document
+
+
+# Selector index <-> enum mappings (button order in the color scale and shape selectors)
+_SCALE_TO_IDX = {ColorScale.LINEAR: 0, ColorScale.LOG: 1}
+_IDX_TO_SCALE = {index: scale for scale, index in _SCALE_TO_IDX.items()}
+_SHAPE_TO_IDX = {PlotShapeMode.SQUARE: 0, PlotShapeMode.CUSTOM: 1, PlotShapeMode.ASPECT_RATIO: 2}
+_IDX_TO_SHAPE = {index: mode for mode, index in _SHAPE_TO_IDX.items()}
+
+
+def _set_if_changed(obj: Any, attr: str, value: Any) -> None:
+    """Assign obj.attr = value only if it differs, so unchanged widget syncs send no event."""
+    if getattr(obj, attr) != value:
+        setattr(obj, attr, value)
+
+
+def _option_values(options: Any) -> List[Any]:
+    """
+    Return the values of Select options.
+    
+    Options may be plain values, (value, label) pairs, or a dict mapping group
+    names to either form.
+    """
+    if isinstance(options, dict):
+        return [value for group in options.values() for value in _option_values(group)]
+    return [option[0] if isinstance(option, (tuple, list)) else option for option in options]
+
+
+def _parse_int(text: Optional[str], default: Any) -> Any:
+    """Parse an integer input value, returning default for empty or non-integer text."""
+    if not text:
+        return default
+    text = text.strip()
+    digits = text[1:] if text[:1] in ("-", "+") else text
+    return int(text) if digits.isdecimal() else default
+
+
+def _parse_float(text: Optional[str], default: Any) -> Any:
+    """Parse a float input value, returning default for empty or invalid text."""
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
 
 
 def sync_plot_to_range_inputs(
@@ -27,17 +77,15 @@ def sync_plot_to_range_inputs(
         max_input: TextInput widget for maximum value
     """
     if plot.range_mode == RangeMode.USER_SPECIFIED:
-        min_input.value = str(plot.range_min)
-        max_input.value = str(plot.range_max)
+        _set_if_changed(min_input, "value", str(plot.range_min))
+        _set_if_changed(max_input, "value", str(plot.range_max))
     elif plot.range_mode == RangeMode.DYNAMIC and plot.data is not None:
-        # Calculate dynamic range
-        data_flat = plot.data.flatten() if plot.data.ndim > 1 else plot.data
-        data_flat = data_flat[~np.isnan(data_flat)]
-        if data_flat.size > 0:
-            p1 = float(np.percentile(data_flat, 1))
-            p99 = float(np.percentile(data_flat, 99))
-            min_input.value = str(p1)
-            max_input.value = str(p99)
+        # Calculate dynamic range (memoized while the data array is unchanged)
+        percentile_range = cached_percentile_range(plot.data)
+        if percentile_range is not None:
+            p1, p99 = percentile_range
+            _set_if_changed(min_input, "value", f"{p1:.6g}")
+            _set_if_changed(max_input, "value", f"{p99:.6g}")
 
 
 def sync_range_inputs_to_plot(
@@ -80,10 +128,9 @@ def sync_plot_to_color_scale_selector(
         plot: BasePlot instance
         selector: RadioButtonGroup widget for color scale
     """
-    if plot.color_scale == ColorScale.LINEAR:
-        selector.active = 0
-    elif plot.color_scale == ColorScale.LOG:
-        selector.active = 1
+    index = _SCALE_TO_IDX.get(plot.color_scale)
+    if index is not None:
+        _set_if_changed(selector, "active", index)
 
 
 def sync_color_scale_selector_to_plot(
@@ -99,11 +146,10 @@ def sync_color_scale_selector_to_plot(
         selector: RadioButtonGroup widget for color scale
         update_callback: Optional callback function(use_log: bool) to update Bokeh color mapper
     """
-    use_log = selector.active == 1
-    if selector.active == 0:
-        plot.set_color_scale(ColorScale.LINEAR)
-    elif selector.active == 1:
-        plot.set_color_scale(ColorScale.LOG)
+    scale = _IDX_TO_SCALE.get(selector.active)
+    use_log = scale is ColorScale.LOG
+    if scale is not None:
+        plot.set_color_scale(scale)
     
     # Call the update callback to actually change the Bokeh color mapper
     if update_callback is not None:
@@ -126,7 +172,7 @@ def sync_plot_to_palette_selector(
         plot: BasePlot instance
         selector: Select widget for palette
     """
-    selector.value = plot.palette
+    _set_if_changed(selector, "value", plot.palette)
 
 
 def sync_palette_selector_to_plot(
@@ -139,109 +185,129 @@ def sync_palette_selector_to_plot(
     Args:
         plot: BasePlot instance
         selector: Select widget for palette
+        
+    Values that are not among the selector's options are rejected with a
+    warning; values equal to the current palette are ignored.
     """
-    plot.set_palette(selector.value)
+    value = selector.value
+    # O(1) check for the default palettes; custom option lists fall back to a scan
+    if value not in DEFAULT_PALETTES_SET and value not in _option_values(selector.options):
+        print(f"⚠️ Ignoring palette {value!r}: not one of the selector's options")
+        return
+    if value != plot.palette:
+        plot.set_palette(value)
 
 
 def sync_plot_to_shape_controls(
     plot: BasePlot,
-    shape_selector: Any,
-    custom_width_input: Any,
-    custom_height_input: Any,
-    scale_input: Any,
-    min_size_input: Any,
-    max_size_input: Any,
+    shape_selector: Union[Any, ShapeControls],
+    custom_width_input: Optional[Any] = None,
+    custom_height_input: Optional[Any] = None,
+    scale_input: Optional[Any] = None,
+    min_size_input: Optional[Any] = None,
+    max_size_input: Optional[Any] = None,
 ) -> None:
     """
     Update plot shape controls from plot state.
     
     Args:
         plot: BasePlot instance
-        shape_selector: RadioButtonGroup for shape mode
-        custom_width_input: TextInput for custom width
-        custom_height_input: TextInput for custom height
-        scale_input: TextInput for scale percentage
-        min_size_input: TextInput for minimum size
-        max_size_input: TextInput for maximum size
+        shape_selector: RadioButtonGroup for shape mode, or the ShapeControls
+            returned by create_plot_shape_controls (the other inputs are then taken from it)
+        custom_width_input: Optional TextInput for custom width
+        custom_height_input: Optional TextInput for custom height
+        scale_input: Optional TextInput for scale percentage
+        min_size_input: Optional TextInput for minimum size
+        max_size_input: Optional TextInput for maximum size
+        
+    Inputs passed as None are skipped. Widgets that already show the plot's
+    value are not written.
     """
-    # Set shape mode
-    if plot.plot_shape_mode == PlotShapeMode.SQUARE:
-        shape_selector.active = 0
-    elif plot.plot_shape_mode == PlotShapeMode.CUSTOM:
-        shape_selector.active = 1
-    elif plot.plot_shape_mode == PlotShapeMode.ASPECT_RATIO:
-        shape_selector.active = 2
-    
-    # Set custom dimensions
-    if plot.plot_width is not None:
-        custom_width_input.value = str(int(plot.plot_width))
-    if plot.plot_height is not None:
-        custom_height_input.value = str(int(plot.plot_height))
-    
-    # Set scale (if aspect ratio mode)
-    if plot.plot_scale is not None:
-        scale_input.value = str(int(plot.plot_scale * 100))  # Convert to percentage
+    if isinstance(shape_selector, ShapeControls):
+        shape_selector, custom_width_input, custom_height_input, scale_input, min_size_input, max_size_input = (
+            shape_selector[:6]
+        )
     
-    # Set size limits
-    if plot.plot_min_size is not None:
-        min_size_input.value = str(int(plot.plot_min_size))
-    if plot.plot_max_size is not None:
-        max_size_input.value = str(int(plot.plot_max_size))
+    # Coalesce the widget writes into one document patch
+    with hold_document():
+        # Set shape mode
+        index = _SHAPE_TO_IDX.get(plot.plot_shape_mode)
+        if index is not None:
+            _set_if_changed(shape_selector, "active", index)
+        
+        # Set custom dimensions
+        if custom_width_input is not None and plot.plot_width is not None:
+            _set_if_changed(custom_width_input, "value", str(int(plot.plot_width)))
+        if custom_height_input is not None and plot.plot_height is not None:
+            _set_if_changed(custom_height_input, "value", str(int(plot.plot_height)))
+        
+        # Set scale (if aspect ratio mode)
+        if scale_input is not None and plot.plot_scale is not None:
+            _set_if_changed(scale_input, "value", str(int(plot.plot_scale * 100)))  # Convert to percentage
+        
+        # Set size limits
+        if min_size_input is not None and plot.plot_min_size is not None:
+            _set_if_changed(min_size_input, "value", str(int(plot.plot_min_size)))
+        if max_size_input is not None and plot.plot_max_size is not None:
+            _set_if_changed(max_size_input, "value", str(int(plot.plot_max_size)))
 
 
 def sync_shape_controls_to_plot(
     plot: BasePlot,
-    shape_selector: Any,
-    custom_width_input: Any,
-    custom_height_input: Any,
-    scale_input: Any,
-    min_size_input: Any,
-    max_size_input: Any,
+    shape_selector: Union[Any, ShapeControls],
+    custom_width_input: Optional[Any] = None,
+    custom_height_input: Optional[Any] = None,
+    scale_input: Optional[Any] = None,
+    min_size_input: Optional[Any] = None,
+    max_size_input: Optional[Any] = None,
 ) -> None:
     """
     Update plot shape from control widgets.
     
     Args:
         plot: BasePlot instance
-        shape_selector: RadioButtonGroup for shape mode
-        custom_width_input: TextInput for custom width
-        custom_height_input: TextInput for custom height
-        scale_input: TextInput for scale percentage
-        min_size_input: TextInput for minimum size
-        max_size_input: TextInput for maximum size
+        shape_selector: RadioButtonGroup for shape mode, or the ShapeControls
+            returned by create_plot_shape_controls (the other inputs are then taken from it)
+        custom_width_input: Optional TextInput for custom width
+        custom_height_input: Optional TextInput for custom height
+        scale_input: Optional TextInput for scale percentage
+        min_size_input: Optional TextInput for minimum size
+        max_size_input: Optional TextInput for maximum size
+        
+    Inputs passed as None are skipped.
     """
+    if isinstance(shape_selector, ShapeControls):
+        shape_selector, custom_width_input, custom_height_input, scale_input, min_size_input, max_size_input = (
+            shape_selector[:6]
+        )
+    
     # Update shape mode
-    if shape_selector.active == 0:
-        plot.plot_shape_mode = PlotShapeMode.SQUARE
-    elif shape_selector.active == 1:
-        plot.plot_shape_mode = PlotShapeMode.CUSTOM
-    elif shape_selector.active == 2:
-        plot.plot_shape_mode = PlotShapeMode.ASPECT_RATIO
+    shape_mode = _IDX_TO_SHAPE.get(shape_selector.active)
+    if shape_mode is not None:
+        plot.plot_shape_mode = shape_mode
     
-    # Update dimensions
-    try:
-        if custom_width_input.value:
-            plot.plot_width = int(custom_width_input.value)
-        if custom_height_input.value:
-            plot.plot_height = int(custom_height_input.value)
-    except (ValueError, TypeError):
-        pass
+    # Update dimensions (inputs that are empty or do not parse leave the plot unchanged)
+    if custom_width_input is not None:
+        _set_if_changed(plot, "plot_width", _parse_int(custom_width_input.value, plot.plot_width))
+    if custom_height_input is not None:
+        _set_if_changed(plot, "plot_height", _parse_int(custom_height_input.value, plot.plot_height))
     
     # Update scale
-    try:
-        if scale_input.value:
-            plot.plot_scale = float(scale_input.value) / 100.0  # Convert from percentage
-    except (ValueError, TypeError):
-        pass
+    if scale_input is not None:
+        scale = _parse_float(scale_input.value, None)
+        if scale is not None:
+            _set_if_changed(plot, "plot_scale", scale / 100.0)  # Convert from percentage
     
     # Update size limits
-    try:
-        if min_size_input.value:
-            plot.plot_min_size = int(min_size_input.value)
-        if max_size_input.value:
-            plot.plot_max_size = int(max_size_input.value)
-    except (ValueError, TypeError):
-        pass
+    if min_size_input is not None:
+        _set_if_changed(plot, "plot_min_size", _parse_int(min_size_input.value, plot.plot_min_size))
+    if max_size_input is not None:
+        _set_if_changed(plot, "plot_max_size", _parse_int(max_size_input.value, plot.plot_max_size))
+
+
+# Crosshair display text when a coordinate is unset
+_X_NONE = "    X: --"
+_Y_NONE = "    Y: --"
 
 
 def sync_plot_to_crosshair_display(
@@ -259,9 +325,11 @@ def sync_plot_to_crosshair_display(
     """
     if plot.crosshairs_enabled:
         if x_display:
-            x_display.text = f"    X: {plot.crosshair_x:.3f}" if plot.crosshair_x is not None else "    X: --"
+            x = plot.crosshair_x
+            _set_if_changed(x_display, "text", f"    X: {x:.3f}" if x is not None else _X_NONE)
         if y_display:
-            y_display.text = f"    Y: {plot.crosshair_y:.3f}" if plot.crosshair_y is not None else "    Y: --"
+            y = plot.crosshair_y
+            _set_if_changed(y_display, "text", f"    Y: {y:.3f}" if y is not None else _Y_NONE)
 
 
 def sync_plot_to_selection_display(
@@ -281,11 +349,51 @@ def sync_plot_to_selection_display(
         max_x = plot.select_region_max_x or 0
         max_y = plot.select_region_max_y or 0
         
-        display.text = (
-            f"Selection: ({min_x:.1f}, {min_y:.1f}) to ({max_x:.1f}, {max_y:.1f})"
+        _set_if_changed(
+            display,
+            "text",
+            f"Selection: ({min_x:.1f}, {min_y:.1f}) to ({max_x:.1f}, {max_y:.1f})",
         )
 
 
+def _debounce(fn: Callable[[str, Any, Any], None], wait_ms: int = 200) -> Callable[[str, Any, Any], None]:
+    """
+    Wrap an on_change callback so a burst of changes runs it only once.
+    
+    Each change schedules fn on a document timeout; only the most recent
+    scheduled call actually runs. Outside a Bokeh server session (or with
+    wait_ms <= 0) fn is returned unchanged.
+    
+    Args:
+        fn: Callback taking (attr, old, new)
+        wait_ms: Quiet period in milliseconds
+        
+    Returns:
+        Debounced callback
+    """
+    if wait_ms <= 0:
+        return fn
+    
+    state = {"token": 0}
+    
+    def debounced(attr, old, new):
+        doc = curdoc()
+        if doc.session_context is None:
+            fn(attr, old, new)
+            return
+        
+        state["token"] += 1
+        token = state["token"]
+        
+        def fire():
+            if token == state["token"]:
+                fn(attr, old, new)
+        
+        doc.add_timeout_callback(fire, wait_ms)
+    
+    return debounced
+
+
 def create_sync_callbacks(
     plot: BasePlot,
     min_input: Any,
@@ -293,6 +401,7 @@ def create_sync_callbacks(
     color_scale_selector: Any,
     palette_selector: Any,
     color_scale_update_callback: Optional[Callable[[bool], None]] = None,
+    debounce_ms: int = 200,
 ) -> Dict[str, Callable]:
     """
     Create callback functions that sync UI widgets to plot state.
@@ -304,9 +413,17 @@ def create_sync_callbacks(
         color_scale_selector: Color scale selector widget
         palette_selector: Palette selector widget
         color_scale_update_callback: Optional callback function(use_log: bool) to update Bokeh color mapper
+        debounce_ms: For the live range, color scale and palette callbacks, only the
+            last change within this many milliseconds is applied (0 disables debouncing)
         
     Returns:
-        Dictionary of callback functions
+        Dictionary of callback functions: "range", "color_scale" and "palette"
+        on_change handlers, plus a no-argument "bulk" callable that applies all
+        three syncs in one document hold.
+        
+        Register "range" on the inputs' committed "value" (Enter/blur) only. For
+        live feedback while typing, register the debounced "range_live" on
+        "value_input", e.g. via create_range_inputs(live_callback=...).
     """
     def on_range_change(attr, old, new):
         sync_range_inputs_to_plot(plot, min_input, max_input)
@@ -318,10 +435,19 @@ def create_sync_callbacks(
     def on_palette_change(attr, old, new):
         sync_palette_selector_to_plot(plot, palette_selector)
     
+    def on_bulk():
+        # Apply all three syncs as one coordinated update (e.g. after a reset)
+        with hold_document():
+            sync_range_inputs_to_plot(plot, min_input, max_input)
+            sync_color_scale_selector_to_plot(plot, color_scale_selector, update_callback=color_scale_update_callback)
+            sync_palette_selector_to_plot(plot, palette_selector)
+    
     return {
         "range": on_range_change,
-        "color_scale": on_color_scale_change,
-        "palette": on_palette_change,
+        "range_live": _debounce(on_range_change, debounce_ms),
+        "color_scale": _debounce(on_color_scale_change, debounce_ms),
+        "palette": _debounce(on_palette_change, debounce_ms),
+        "bulk": on_bulk,
     }
 
 
@@ -354,18 +480,20 @@ def sync_all_plot_ui(
         min_size_input: Optional minimum size input
         max_size_input: Optional maximum size input
     """
-    sync_plot_to_range_inputs(plot, min_input, max_input)
-    sync_plot_to_color_scale_selector(plot, color_scale_selector)
-    sync_plot_to_palette_selector(plot, palette_selector)
-    
-    if shape_selector is not None:
-        sync_plot_to_shape_controls(
-            plot,
-            shape_selector,
-            custom_width_input or create_text_input("", ""),
-            custom_height_input or create_text_input("", ""),
-            scale_input or create_text_input("", ""),
-            min_size_input or create_text_input("", ""),
-            max_size_input or create_text_input("", ""),
-        )
+    # Coalesce the widget writes into one document patch
+    with hold_document():
+        sync_plot_to_range_inputs(plot, min_input, max_input)
+        sync_plot_to_color_scale_selector(plot, color_scale_selector)
+        sync_plot_to_palette_selector(plot, palette_selector)
+        
+        if shape_selector is not None:
+            sync_plot_to_shape_controls(
+                plot,
+                shape_selector,
+                custom_width_input,
+                custom_height_input,
+                scale_input,
+                min_size_input,
+                max_size_input,
+            )
 
@@ -5,15 +5,104 @@ This module provides undo/redo functionality for plot and session states,
 allowing users to revert changes and restore previous states.
 """
 
-from typing import List, Optional, Dict, Any, Callable
+from collections import deque
+from functools import partial
+from typing import Deque, List, Optional, Dict, Any, Callable, Tuple
 from datetime import datetime
-import copy
-import json
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
 
 from .SCDash_base_plot import BasePlot
 from .SCDash_state_manager import PlotSession
 
 
+def _to_builtin(value: Any) -> Any:
+    """
+    Serialize values the JSON encoder does not handle natively.
+    
+    NumPy scalars and arrays are converted with tolist(), so a restored state
+    holds Python numbers and lists rather than their string form. Anything
+    else falls back to str().
+    """
+    tolist = getattr(value, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return str(value)
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def _dumps(state: Dict[str, Any]) -> bytes:
+        """Serialize a state dict to JSON bytes."""
+        return orjson.dumps(state, default=_to_builtin, option=_ORJSON_OPTIONS)
+    
+    _loads = orjson.loads
+else:
+    import json
+    
+    def _dumps(state: Dict[str, Any]) -> bytes:
+        """Serialize a state dict to JSON bytes."""
+        return json.dumps(state, default=_to_builtin).encode()
+    
+    _loads = json.loads
+
+
+if XXHASH_AVAILABLE:
+    _hash_bytes = xxhash.xxh3_64_intdigest
+else:
+    _hash_bytes = hash
+
+
+if ZSTANDARD_AVAILABLE:
+    # Level 1 keeps compression well under a millisecond for typical states
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=1)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+    _compress = _ZSTD_COMPRESSOR.compress
+    _decompress = _ZSTD_DECOMPRESSOR.decompress
+else:
+    def _compress(blob: bytes) -> bytes:
+        """Store serialized states as-is when zstandard is not installed."""
+        return blob
+    
+    _decompress = _compress
+
+
+# (perf_counter_ns >> 20, iso string) of the last timestamp produced
+_TS_CACHE = [0, ""]
+
+
+def _fast_iso() -> str:
+    """
+    Return ``datetime.now().isoformat()``, reused within a ~1 ms window.
+    
+    Slider drags can save several states per millisecond; they share one
+    timestamp string instead of each allocating a datetime.
+    """
+    bucket = time.perf_counter_ns() >> 20
+    if bucket != _TS_CACHE[0]:
+        _TS_CACHE[0] = bucket
+        _TS_CACHE[1] = datetime.now().isoformat()
+    return _TS_CACHE[1]
+
+
 class StateHistory:
     """
     Manages undo/redo history for plot or session states.
@@ -22,6 +111,18 @@ class StateHistory:
     navigate backwards (undo) and forwards (redo) through changes.
     """
     
+    __slots__ = (
+        "max_history",
+        "history",
+        "current_index",
+        "_save_callback",
+        "_restore_callback",
+        "_last_hash",
+        "_pending_initial",
+        "_summary_version",
+        "_summary_cache",
+    )
+    
     def __init__(self, max_history: int = 50):
         """
         Initialize state history.
@@ -30,10 +131,16 @@ class StateHistory:
             max_history: Maximum number of states to keep in history
         """
         self.max_history = max_history
-        self.history: List[Dict[str, Any]] = []
+        # Bounded deque: appending beyond max_history drops the oldest state in O(1)
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
         self.current_index: int = -1
         self._save_callback: Optional[Callable[[], Dict[str, Any]]] = None
         self._restore_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._last_hash: Optional[int] = None
+        self._pending_initial: Optional[Tuple[Dict[str, Any], str]] = None
+        # Bumped on every history mutation; get_history_summary caches per version
+        self._summary_version: int = 0
+        self._summary_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
     
     def set_callbacks(
         self,
@@ -58,40 +165,92 @@ class StateHistory:
             description: Optional description of this state
             
         Returns:
-            True if state was saved, False if callbacks not set
+            True if state was saved, False if callbacks not set or the state
+            is identical to the current one
         """
         if self._save_callback is None:
             return False
         
-        state = self._save_callback()
-        state["timestamp"] = datetime.now().isoformat()
-        state["description"] = description or "State change"
+        # The deferred initial state must land in history before this one
+        if self._pending_initial is not None:
+            self._flush_initial_state()
+        
+        return self._store_state(self._save_callback(), description)
+    
+    def _store_state(self, state: Dict[str, Any], description: Optional[str]) -> bool:
+        """
+        Serialize a captured state and append it to history.
+        
+        Args:
+            state: State returned by the save callback
+            description: Optional description of this state
+            
+        Returns:
+            True if state was saved, False if it is identical to the current one
+        """
+        # Widgets often re-fire with unchanged values; skip identical snapshots
+        blob = _dumps(state)
+        state_hash = _hash_bytes(blob)
+        if state_hash == self._last_hash:
+            return False
+        self._last_hash = state_hash
         
         # Remove any states after current index (when undoing and then making new changes)
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
+        while len(self.history) > self.current_index + 1:
+            self.history.pop()
         
         # Add new state
-        # Use shallow copy with recursive dict copy for better performance than deepcopy
-        # Since state only contains simple types (str, float, bool, None, dict, list), 
-        # we can safely use a shallow copy approach
-        def shallow_copy_dict(d):
-            """Create a shallow copy of a dict, recursively copying nested dicts."""
-            if not isinstance(d, dict):
-                return d
-            return {k: shallow_copy_dict(v) if isinstance(v, dict) else v for k, v in d.items()}
-        
-        state_copy = shallow_copy_dict(state)
-        self.history.append(state_copy)
-        
-        # Limit history size
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-        else:
-            self.current_index += 1
+        # Snapshots are kept as immutable compressed bytes rather than live dict
+        # trees; they are only parsed again when undo/redo restores them.
+        # Metadata sits next to the payload so restoring never has to filter it out.
+        self.history.append({
+            "payload": _compress(blob),
+            "timestamp": _fast_iso(),
+            "description": description or "State change",
+        })
+        
+        # The deque already enforces max_history; the new state is always the last one
+        self.current_index = len(self.history) - 1
+        self._summary_version += 1
         
         return True
     
+    def _defer_initial_state(
+        self,
+        description: str,
+        schedule: Optional[Callable[[Callable[[], None]], Any]] = None,
+    ) -> None:
+        """
+        Record the initial state, serializing it later if a scheduler is given.
+        
+        The state is captured right away, so changes made after construction
+        never leak into the initial snapshot. With a scheduler (e.g. a Bokeh
+        document's add_next_tick_callback) only the serialization and
+        compression are postponed, so constructing many histories does not
+        encode every plot up front. A save_state() call that arrives first
+        stores the initial state before its own.
+        
+        Args:
+            description: Description for the initial state
+            schedule: Optional callable that runs a callback later
+        """
+        if self._save_callback is None:
+            return
+        state = self._save_callback()
+        if schedule is None:
+            self._store_state(state, description)
+            return
+        
+        self._pending_initial = (state, description)
+        schedule(self._flush_initial_state)
+    
+    def _flush_initial_state(self) -> None:
+        """Store the pending initial state, if any."""
+        pending = self._pending_initial
+        if pending is not None:
+            self._pending_initial = None
+            self._store_state(*pending)
+    
     def can_undo(self) -> bool:
         """Check if undo is possible."""
         return self.current_index > 0
@@ -114,14 +273,7 @@ class StateHistory:
             return False
         
         self.current_index -= 1
-        # No need to deepcopy - state is already a copy in history
-        previous_state = self.history[self.current_index]
-        
-        # Remove metadata before restoring
-        state_to_restore = {k: v for k, v in previous_state.items() 
-                           if k not in ["timestamp", "description"]}
-        
-        self._restore_callback(state_to_restore)
+        self._restore_entry(self.history[self.current_index])
         return True
     
     def redo(self) -> bool:
@@ -138,16 +290,16 @@ class StateHistory:
             return False
         
         self.current_index += 1
-        # No need to deepcopy - state is already a copy in history
-        next_state = self.history[self.current_index]
-        
-        # Remove metadata before restoring
-        state_to_restore = {k: v for k, v in next_state.items() 
-                           if k not in ["timestamp", "description"]}
-        
-        self._restore_callback(state_to_restore)
+        self._restore_entry(self.history[self.current_index])
         return True
     
+    def _restore_entry(self, entry: Dict[str, Any]) -> None:
+        """Decode a history entry and pass the state to the restore callback."""
+        blob = _decompress(entry["payload"])
+        self._restore_callback(_loads(blob))
+        self._last_hash = _hash_bytes(blob)
+        self._summary_version += 1
+    
     def get_current_state_info(self) -> Optional[Dict[str, Any]]:
         """
         Get information about current state.
@@ -158,10 +310,10 @@ class StateHistory:
         if self.current_index < 0 or self.current_index >= len(self.history):
             return None
         
-        state = self.history[self.current_index]
+        entry = self.history[self.current_index]
         return {
-            "timestamp": state.get("timestamp"),
-            "description": state.get("description"),
+            "timestamp": entry["timestamp"],
+            "description": entry["description"],
             "index": self.current_index,
             "total": len(self.history)
         }
@@ -170,23 +322,36 @@ class StateHistory:
         """Clear all history."""
         self.history.clear()
         self.current_index = -1
+        self._last_hash = None
+        self._pending_initial = None
+        self._summary_version += 1
     
     def get_history_summary(self) -> List[Dict[str, Any]]:
         """
         Get a summary of all states in history.
         
+        The summary is rebuilt only after save_state, undo, redo or clear;
+        repeated calls in between return the same list, which callers should
+        treat as read-only.
+        
         Returns:
             List of state info dictionaries
         """
-        return [
+        cache = self._summary_cache
+        if cache is not None and cache[0] == self._summary_version:
+            return cache[1]
+        
+        summary = [
             {
                 "index": i,
-                "timestamp": state.get("timestamp"),
-                "description": state.get("description"),
+                "timestamp": entry["timestamp"],
+                "description": entry["description"],
                 "is_current": i == self.current_index
             }
-            for i, state in enumerate(self.history)
+            for i, entry in enumerate(self.history)
         ]
+        self._summary_cache = (self._summary_version, summary)
+        return summary
 
 
 class PlotStateHistory(StateHistory):
@@ -194,33 +359,37 @@ class PlotStateHistory(StateHistory):
     State history manager for a single plot.
     """
     
-    def __init__(self, plot: BasePlot, max_history: int = 50):
+    __slots__ = ("plot",)
+    
+    def __init__(
+        self,
+        plot: BasePlot,
+        max_history: int = 50,
+        schedule: Optional[Callable[[Callable[[], None]], Any]] = None,
+    ):
         """
         Initialize plot state history.
         
+        The initial state is captured during construction. Pass a scheduler
+        such as doc.add_next_tick_callback to serialize it later.
+        
         Args:
             plot: BasePlot instance to track
             max_history: Maximum number of states to keep
+            schedule: Optional callable that runs a callback later, used to
+                serialize the initial state off the construction path
         """
         super().__init__(max_history)
         self.plot = plot
         
-        # Set up callbacks
+        # Set up callbacks, bound straight to the plot's own methods
         self.set_callbacks(
-            save_callback=self._save_plot_state,
-            restore_callback=self._restore_plot_state
+            save_callback=partial(plot.get_state, include_data=False),
+            restore_callback=partial(plot.load_state, restore_data=False)
         )
         
-        # Save initial state
-        self.save_state("Initial state")
-    
-    def _save_plot_state(self) -> Dict[str, Any]:
-        """Save current plot state."""
-        return self.plot.get_state(include_data=False)
-    
-    def _restore_plot_state(self, state: Dict[str, Any]) -> None:
-        """Restore plot state."""
-        self.plot.load_state(state, restore_data=False)
+        # Save initial state (serialized later when a scheduler is given)
+        self._defer_initial_state("Initial state", schedule)
 
 
 class SessionStateHistory(StateHistory):
@@ -228,29 +397,37 @@ class SessionStateHistory(StateHistory):
     State history manager for a plot session.
     """
     
-    def __init__(self, session: PlotSession, max_history: int = 50):
+    __slots__ = ("session",)
+    
+    def __init__(
+        self,
+        session: PlotSession,
+        max_history: int = 50,
+        schedule: Optional[Callable[[Callable[[], None]], Any]] = None,
+    ):
         """
         Initialize session state history.
         
+        The initial state is captured during construction. Pass a scheduler
+        such as doc.add_next_tick_callback to serialize it later.
+        
         Args:
             session: PlotSession instance to track
             max_history: Maximum number of states to keep
+            schedule: Optional callable that runs a callback later, used to
+                serialize the initial state off the construction path
         """
         super().__init__(max_history)
         self.session = session
         
         # Set up callbacks
         self.set_callbacks(
-            save_callback=self._save_session_state,
+            save_callback=partial(session.get_session_state, include_data=False),
             restore_callback=self._restore_session_state
         )
         
-        # Save initial state
-        self.save_state("Initial session state")
-    
-    def _save_session_state(self) -> Dict[str, Any]:
-        """Save current session state."""
-        return self.session.get_session_state(include_data=False)
+        # Save initial state (serialized later when a scheduler is given)
+        self._defer_initial_state("Initial session state", schedule)
     
     def _restore_session_state(self, state: Dict[str, Any]) -> None:
         """Restore session state."""
@@ -296,10 +473,12 @@ class SessionStateHistory(StateHistory):
                 print(f"🔍 DEBUG: session.metadata['y_slider_value'] = {self.session.metadata['y_slider_value']}")
         
         plots_state = state.get("plots", {})
+        plots = self.session.plots
         for plot_id, plot_state in plots_state.items():
-            if plot_id in self.session.plots:
+            plot = plots.get(plot_id)
+            if plot is not None:
                 # Restore existing plot
-                self.session.plots[plot_id].load_state(plot_state, restore_data=False)
+                plot.load_state(plot_state, restore_data=False)
             # Note: New plots would need to be created based on plot_type in state
 
 
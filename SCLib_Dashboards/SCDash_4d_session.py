@@ -25,6 +25,24 @@ class FourDDashboardSession(PlotSession):
     across different dashboard implementations.
     """
     
+    # Dataset selection keys, in the order of the __init__ parameters
+    _FIELDS = (
+        "volume_picked",
+        "plot1_single_dataset_picked",
+        "presample_picked",
+        "postsample_picked",
+        "x_coords_picked",
+        "y_coords_picked",
+        "probe_x_coords_picked",
+        "probe_y_coords_picked",
+        "volume_picked_b",
+        "plot1b_single_dataset_picked",
+        "presample_picked_b",
+        "postsample_picked_b",
+        "probe_x_coords_picked_b",
+        "probe_y_coords_picked_b",
+    )
+    
     def __init__(
         self,
         session_id: Optional[str] = None,
@@ -68,36 +86,52 @@ class FourDDashboardSession(PlotSession):
             **kwargs: Additional metadata to include
         """
         # Build metadata dictionary with 4D-specific fields
-        metadata = {
-            "dashboard_type": "4d",
-            "dataset_path": volume_picked or "unknown",
-            "volume_picked": volume_picked,
-            "plot1_single_dataset_picked": plot1_single_dataset_picked,
-            "presample_picked": presample_picked,
-            "postsample_picked": postsample_picked,
-            "x_coords_picked": x_coords_picked,
-            "y_coords_picked": y_coords_picked,
-            "probe_x_coords_picked": probe_x_coords_picked,
-            "probe_y_coords_picked": probe_y_coords_picked,
-            "volume_picked_b": volume_picked_b,
-            "plot1b_single_dataset_picked": plot1b_single_dataset_picked,
-            "presample_picked_b": presample_picked_b,
-            "postsample_picked_b": postsample_picked_b,
-            "probe_x_coords_picked_b": probe_x_coords_picked_b,
-            "probe_y_coords_picked_b": probe_y_coords_picked_b,
-            "plot1_mode": "single" if plot1_single_dataset_picked else "ratio",
-            "plot1b_mode": "single" if plot1b_single_dataset_picked else "ratio",
-            "plot1b_enabled": bool(plot1b_single_dataset_picked or presample_picked_b),
-            "plot2b_enabled": bool(volume_picked_b),
-            "user_email": user_email,
-            **kwargs
-        }
+        metadata = dict(zip(self._FIELDS, (
+            volume_picked,
+            plot1_single_dataset_picked,
+            presample_picked,
+            postsample_picked,
+            x_coords_picked,
+            y_coords_picked,
+            probe_x_coords_picked,
+            probe_y_coords_picked,
+            volume_picked_b,
+            plot1b_single_dataset_picked,
+            presample_picked_b,
+            postsample_picked_b,
+            probe_x_coords_picked_b,
+            probe_y_coords_picked_b,
+        )))
+        metadata["dashboard_type"] = "4d"
+        metadata["dataset_path"] = volume_picked or "unknown"
+        metadata["plot1_mode"] = "single" if plot1_single_dataset_picked else "ratio"
+        metadata["plot1b_mode"] = "single" if plot1b_single_dataset_picked else "ratio"
+        metadata["plot1b_enabled"] = bool(plot1b_single_dataset_picked or presample_picked_b)
+        metadata["plot2b_enabled"] = bool(volume_picked_b)
+        metadata["user_email"] = user_email
+        metadata.update(kwargs)
         
         # Generate session_id if not provided
         if session_id is None:
             session_id = f"4d_dashboard_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         super().__init__(session_id=session_id, metadata=metadata)
+        
+        # Whether dataset selection updates are logged to session_changes
+        self._track_changes = True
+    
+    def enable_change_tracking(self) -> None:
+        """Log dataset selection updates to the session change log (default)."""
+        self._track_changes = True
+    
+    def disable_change_tracking(self) -> None:
+        """
+        Stop logging dataset selection updates.
+        
+        Useful when selections are updated at a high rate and the session is not
+        being audited; last_updated and session_changes are then left untouched.
+        """
+        self._track_changes = False
     
     @property
     def volume_picked(self) -> Optional[str]:
@@ -155,60 +189,55 @@ class FourDDashboardSession(PlotSession):
             probe_x_coords_picked_b: Probe X coordinates B dataset path
             probe_y_coords_picked_b: Probe Y coordinates B dataset path
         """
-        if volume_picked is not None:
-            self.metadata["volume_picked"] = volume_picked
-            self.metadata["dataset_path"] = volume_picked
+        metadata = self.metadata
         
-        if plot1_single_dataset_picked is not None:
-            self.metadata["plot1_single_dataset_picked"] = plot1_single_dataset_picked
-            self.metadata["plot1_mode"] = "single" if plot1_single_dataset_picked else "ratio"
-        
-        if presample_picked is not None:
-            self.metadata["presample_picked"] = presample_picked
-        
-        if postsample_picked is not None:
-            self.metadata["postsample_picked"] = postsample_picked
-        
-        if x_coords_picked is not None:
-            self.metadata["x_coords_picked"] = x_coords_picked
-        
-        if y_coords_picked is not None:
-            self.metadata["y_coords_picked"] = y_coords_picked
-        
-        if probe_x_coords_picked is not None:
-            self.metadata["probe_x_coords_picked"] = probe_x_coords_picked
-        
-        if probe_y_coords_picked is not None:
-            self.metadata["probe_y_coords_picked"] = probe_y_coords_picked
-        
-        if volume_picked_b is not None:
-            self.metadata["volume_picked_b"] = volume_picked_b
-            self.metadata["plot2b_enabled"] = bool(volume_picked_b)
-        
-        if plot1b_single_dataset_picked is not None:
-            self.metadata["plot1b_single_dataset_picked"] = plot1b_single_dataset_picked
-            self.metadata["plot1b_mode"] = "single" if plot1b_single_dataset_picked else "ratio"
+        # Collect the provided selections and apply them in one update
+        updates = {
+            key: value
+            for key, value in zip(self._FIELDS, (
+                volume_picked,
+                plot1_single_dataset_picked,
+                presample_picked,
+                postsample_picked,
+                x_coords_picked,
+                y_coords_picked,
+                probe_x_coords_picked,
+                probe_y_coords_picked,
+                volume_picked_b,
+                plot1b_single_dataset_picked,
+                presample_picked_b,
+                postsample_picked_b,
+                probe_x_coords_picked_b,
+                probe_y_coords_picked_b,
+            ))
+            if value is not None
+        }
+        metadata.update(updates)
         
-        if presample_picked_b is not None:
-            self.metadata["presample_picked_b"] = presample_picked_b
-            self.metadata["plot1b_enabled"] = bool(plot1b_single_dataset_picked or presample_picked_b)
+        # Derived fields only change when one of their inputs was provided
+        if "volume_picked" in updates:
+            metadata["dataset_path"] = volume_picked
         
-        if postsample_picked_b is not None:
-            self.metadata["postsample_picked_b"] = postsample_picked_b
+        if "plot1_single_dataset_picked" in updates:
+            metadata["plot1_mode"] = "single" if plot1_single_dataset_picked else "ratio"
         
-        if probe_x_coords_picked_b is not None:
-            self.metadata["probe_x_coords_picked_b"] = probe_x_coords_picked_b
+        if "plot1b_single_dataset_picked" in updates:
+            metadata["plot1b_mode"] = "single" if plot1b_single_dataset_picked else "ratio"
         
-        if probe_y_coords_picked_b is not None:
-            self.metadata["probe_y_coords_picked_b"] = probe_y_coords_picked_b
+        # Enabled flags depend on the merged selections, not just this call's arguments
+        metadata["plot1b_enabled"] = bool(
+            metadata.get("plot1b_single_dataset_picked") or metadata.get("presample_picked_b")
+        )
+        metadata["plot2b_enabled"] = bool(metadata.get("volume_picked_b"))
         
-        self.metadata["last_updated"] = datetime.now().isoformat()
-        self._record_session_change("update_dataset_selections", {
-            "volume_picked": volume_picked,
-            "plot1_mode": self.metadata.get("plot1_mode"),
-            "plot1b_enabled": self.metadata.get("plot1b_enabled"),
-            "plot2b_enabled": self.metadata.get("plot2b_enabled"),
-        })
+        # _record_session_change also refreshes last_updated
+        if self._track_changes:
+            self._record_session_change("update_dataset_selections", {
+                "volume_picked": volume_picked,
+                "plot1_mode": metadata.get("plot1_mode"),
+                "plot1b_enabled": metadata.get("plot1b_enabled"),
+                "plot2b_enabled": metadata.get("plot2b_enabled"),
+            })
 
 
 def create_4d_session_from_process_4dnexus(process_4dnexus, user_email: Optional[str] = None) -> FourDDashboardSession:
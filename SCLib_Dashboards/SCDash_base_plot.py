@@ -18,9 +18,12 @@ The class supports:
 """
 
 import numpy as np
+import base64
 import json
+import weakref
 from typing import Optional, Dict, List, Tuple, Any, Union, Callable
 from enum import Enum
+from operator import attrgetter
 from datetime import datetime
 import copy
 
@@ -51,6 +54,187 @@ class RangeMode(Enum):
     USER_SPECIFIED = "user_specified"  # User-provided min/max values
 
 
+# Serialized value of every enum member, so state capture skips the Enum.value descriptor
+_ENUM_VALUES: Dict[Enum, str] = {
+    member: member.value
+    for enum_cls in (DataMode, ColorScale, PlotShapeMode, RangeMode)
+    for member in enum_cls
+}
+
+
+# Enum member for each serialized value, so load_state skips the Enum constructor
+_ENUM_BY_VALUE: Dict[type, Dict[str, Enum]] = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (DataMode, ColorScale, PlotShapeMode, RangeMode)
+}
+
+
+# Cached (p1, p99) dynamic ranges keyed by array identity and buffer layout.
+# Each entry keeps a weak reference to its array, so an entry whose array has
+# been freed (and whose id may be reused) is never returned.
+_range_cache: Dict[Tuple[Any, ...], Tuple[Any, Optional[Tuple[float, float]]]] = {}
+_RANGE_CACHE_SIZE = 32
+
+# Maximum number of values sampled when estimating the dynamic range
+SAMPLE_CAP = 50_000
+
+
+def _range_cache_key(data: np.ndarray) -> Tuple[Any, ...]:
+    """Cheap identity key for an array: object id, shape, dtype, buffer address and size."""
+    return (id(data), data.shape, data.dtype.str, data.__array_interface__["data"][0], data.nbytes)
+
+
+def _percentile_range(data: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Compute the (1st, 99th) percentile range of the non-NaN values in data.
+    
+    Arrays larger than SAMPLE_CAP are estimated from a random sample.
+    The percentiles interpolate linearly between the two samples around each
+    rank, like np.nanpercentile, but a single O(n) partition on those
+    neighbours replaces the sort.
+    
+    Returns:
+        Tuple of (p1, p99), or None if data has no non-NaN values
+    """
+    if data.size == 0:
+        return None
+    if data.size > SAMPLE_CAP:
+        # Uniformly drawn positions (fixed seed, so results are reproducible).
+        # An evenly strided sample would alias with the row width of an image
+        # and only ever see a few of its columns. With SAMPLE_CAP draws the
+        # 1%/99% ranks are off by about 0.05% of the data on average.
+        positions = np.random.default_rng(0).integers(0, data.size, SAMPLE_CAP)
+        positions.sort()
+        # Fancy indexing through .flat copies only the sampled values
+        sample = data.flat[positions]
+        owns_sample = True
+    else:
+        # reshape(-1) is a view for contiguous data
+        sample = data.reshape(-1)
+        owns_sample = False
+    # Boolean indexing also returns a private copy that can be partitioned in
+    # place; views of the caller's data must be copied first
+    if sample.dtype.kind == "f":
+        sample = sample[~np.isnan(sample)]
+        owns_sample = True
+    n = sample.size
+    if n == 0:
+        return None
+    rank1 = 0.01 * (n - 1)
+    rank99 = 0.99 * (n - 1)
+    k1 = int(rank1)
+    k99 = int(rank99)
+    kth = (k1, min(k1 + 1, n - 1), k99, min(k99 + 1, n - 1))
+    if owns_sample:
+        sample.partition(kth)
+    else:
+        sample = np.partition(sample, kth)
+    
+    def interpolate(k: int, rank: float) -> float:
+        lower = float(sample[k])
+        if k + 1 >= n:
+            return lower
+        return lower + (rank - k) * (float(sample[k + 1]) - lower)
+    
+    return interpolate(k1, rank1), interpolate(k99, rank99)
+
+
+def cached_percentile_range(data: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Memoized _percentile_range() for repeated syncs against unchanged data.
+    
+    Arrays modified in place must be invalidated with invalidate_range_cache().
+    
+    Args:
+        data: Data array
+        
+    Returns:
+        Tuple of (p1, p99), or None if data has no non-NaN values
+    """
+    key = _range_cache_key(data)
+    entry = _range_cache.get(key)
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+    
+    result = _percentile_range(data)
+    if len(_range_cache) >= _RANGE_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _range_cache[next(iter(_range_cache))]
+    _range_cache[key] = (weakref.ref(data), result)
+    return result
+
+
+def invalidate_range_cache(data: Optional[np.ndarray] = None) -> None:
+    """
+    Drop cached dynamic ranges.
+    
+    Args:
+        data: Array whose entry to drop; None clears the whole cache
+    """
+    if data is None:
+        _range_cache.clear()
+    else:
+        _range_cache.pop(_range_cache_key(data), None)
+
+
+def _encode_array(array: np.ndarray) -> Union[str, list]:
+    """
+    Encode an array for a JSON state as base64 of its raw bytes.
+    
+    Object arrays have no meaningful raw bytes and fall back to nested lists.
+    """
+    if array.dtype.hasobject:
+        return array.tolist()
+    return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode("ascii")
+
+
+def _write_array_base64(fp: Any, array: np.ndarray, chunk_bytes: int) -> None:
+    """
+    Write an array to a text file as a JSON value, base64-encoding it chunk by chunk.
+    
+    The output matches _encode_array() but never holds the whole encoded
+    string in memory.
+    
+    Args:
+        fp: Writable text file object
+        array: Array to write
+        chunk_bytes: Raw bytes encoded per write (rounded down to a multiple of 3
+            so the chunks concatenate into valid base64)
+    """
+    if array.dtype.hasobject:
+        json.dump(array.tolist(), fp, default=str)
+        return
+    
+    step = max(3, chunk_bytes - chunk_bytes % 3)
+    raw = memoryview(np.ascontiguousarray(array)).cast("B")
+    fp.write('"')
+    for start in range(0, len(raw), step):
+        fp.write(base64.b64encode(raw[start:start + step]).decode("ascii"))
+    fp.write('"')
+
+
+def _decode_array(value: Union[str, list], dtype: Optional[str], shape: Optional[List[int]]) -> np.ndarray:
+    """
+    Decode an array written by _encode_array (or a plain nested list from older states).
+    
+    Args:
+        value: Base64 string or nested list
+        dtype: Stored dtype string (required for base64 values)
+        shape: Stored shape, or None to keep the decoded shape
+        
+    Returns:
+        Decoded array
+    """
+    if isinstance(value, str):
+        # frombuffer returns a read-only view of the decoded bytes; copy so the array is writable
+        array = np.frombuffer(base64.b64decode(value), dtype=np.dtype(dtype)).copy()
+    else:
+        array = np.array(value)
+    if shape is not None:
+        array = array.reshape(tuple(shape))
+    return array
+
+
 class BasePlot:
     """
     Base class for dashboard plots with comprehensive state management.
@@ -59,6 +243,84 @@ class BasePlot:
     methods for state serialization, change tracking, and reset operations.
     """
     
+    __slots__ = (
+        "title",
+        "data_mode",
+        "data",
+        "x_coords",
+        "y_coords",
+        "needs_flip",
+        "palette",
+        "color_scale",
+        "range_mode",
+        "range_min",
+        "range_max",
+        "plot_shape_mode",
+        "plot_width",
+        "plot_height",
+        "plot_min_size",
+        "plot_max_size",
+        "plot_scale",
+        "crosshairs_enabled",
+        "crosshair_x",
+        "crosshair_y",
+        "x_axis_label",
+        "y_axis_label",
+        "x_ticks",
+        "y_ticks",
+        "x_tick_labels",
+        "y_tick_labels",
+        "select_region_enabled",
+        "select_region_min_x",
+        "select_region_min_y",
+        "select_region_max_x",
+        "select_region_max_y",
+        "track_changes",
+        "_change_history",
+        "_initial_state",
+        "_history_base",
+        "_last_recorded_state",
+        "_aspect_cache",
+        "__weakref__",
+    )
+    
+    # Attributes saved as-is by _capture_state (enum fields are then mapped to
+    # their values, and the crosshair tuple is added separately).
+    # NOTE: Axis labels and ticks are NOT saved - they are automatically derived from
+    # coordinate selections in tmp_dashboard and recalculated from coordinate arrays.
+    # This reduces undo/redo state size and improves performance.
+    _STATE_FIELDS = (
+        "title",
+        "data_mode",
+        "palette",
+        "color_scale",
+        "range_mode",
+        "range_min",
+        "range_max",
+        "plot_shape_mode",
+        "plot_width",
+        "plot_height",
+        "plot_min_size",
+        "plot_max_size",
+        "plot_scale",
+        "crosshairs_enabled",
+        "select_region_enabled",
+        "select_region_min_x",
+        "select_region_min_y",
+        "select_region_max_x",
+        "select_region_max_y",
+        "needs_flip",
+    )
+    # Enum-typed state fields, serialized by value
+    _ENUM_STATE_FIELDS = {
+        "data_mode": DataMode,
+        "color_scale": ColorScale,
+        "range_mode": RangeMode,
+        "plot_shape_mode": PlotShapeMode,
+    }
+    # Reads all _STATE_FIELDS in one C-level call, returning a tuple
+    _state_values = attrgetter(*_STATE_FIELDS)
+    
     def __init__(
         self,
         title: str = "Plot",
@@ -178,6 +440,13 @@ class BasePlot:
         self.track_changes = track_changes
         self._change_history: List[Dict[str, Any]] = []
         self._initial_state = self._capture_state(include_data=False)
+        # Change records store only the fields that differ from the previous
+        # record; get_state_at() replays them on top of the base state
+        self._history_base = self._initial_state
+        self._last_recorded_state = self._initial_state
+        
+        # (x_coords, y_coords, aspect ratio) last computed by calculate_plot_dimensions
+        self._aspect_cache: Optional[Tuple[np.ndarray, np.ndarray, float]] = None
         
         # Calculate initial range if dynamic and data is available
         if self.range_mode == RangeMode.DYNAMIC and self.data is not None:
@@ -193,14 +462,11 @@ class BasePlot:
         if self.data is None or self.data.size == 0:
             return 0.0, 1.0
         
-        data_flat = self.data.flatten() if self.data.ndim > 1 else self.data
-        data_flat = data_flat[~np.isnan(data_flat)]
-        
-        if data_flat.size == 0:
+        percentile_range = cached_percentile_range(self.data)
+        if percentile_range is None:
             return 0.0, 1.0
         
-        p1 = float(np.percentile(data_flat, 1))
-        p99 = float(np.percentile(data_flat, 99))
+        p1, p99 = percentile_range
         
         self.range_min = p1
         self.range_max = p99
@@ -217,49 +483,28 @@ class BasePlot:
         Returns:
             Dictionary containing all plot state
         """
-        state = {
-            "title": self.title,
-            "data_mode": self.data_mode.value,
-            "palette": self.palette,
-            "color_scale": self.color_scale.value,
-            "range_mode": self.range_mode.value,
-            "range_min": self.range_min,
-            "range_max": self.range_max,
-            "plot_shape_mode": self.plot_shape_mode.value,
-            "plot_width": self.plot_width,
-            "plot_height": self.plot_height,
-            "plot_min_size": self.plot_min_size,
-            "plot_max_size": self.plot_max_size,
-            "plot_scale": self.plot_scale,
-            "crosshairs_enabled": self.crosshairs_enabled,
-            # Save crosshair position as simple tuple (x, y) instead of separate properties
-            "crosshair": (self.crosshair_x, self.crosshair_y) if (self.crosshair_x is not None and self.crosshair_y is not None) else None,
-            # NOTE: Axis labels and ticks are NOT saved - they are automatically derived from
-            # coordinate selections in tmp_dashboard and recalculated from coordinate arrays.
-            # This reduces undo/redo state size and improves performance.
-            # "x_axis_label": self.x_axis_label,
-            # "y_axis_label": self.y_axis_label,
-            # "x_ticks": self.x_ticks,
-            # "y_ticks": self.y_ticks,
-            # "x_tick_labels": self.x_tick_labels,
-            # "y_tick_labels": self.y_tick_labels,
-            "select_region_enabled": self.select_region_enabled,
-            "select_region_min_x": self.select_region_min_x,
-            "select_region_min_y": self.select_region_min_y,
-            "select_region_max_x": self.select_region_max_x,
-            "select_region_max_y": self.select_region_max_y,
-            "needs_flip": self.needs_flip,
-        }
+        state = dict(zip(self._STATE_FIELDS, self._state_values(self)))
+        for name in self._ENUM_STATE_FIELDS:
+            state[name] = _ENUM_VALUES[state[name]]
+        # Save crosshair position as simple tuple (x, y) instead of separate properties
+        crosshair_x, crosshair_y = self.crosshair_x, self.crosshair_y
+        state["crosshair"] = (crosshair_x, crosshair_y) if (crosshair_x is not None and crosshair_y is not None) else None
         
         if include_data:
+            # Arrays are stored as base64 raw bytes plus dtype/shape rather than
+            # nested lists, which would allocate a Python object per element
             if self.data is not None:
-                state["data"] = self.data.tolist()
+                state["data"] = _encode_array(self.data)
                 state["data_shape"] = list(self.data.shape)
                 state["data_dtype"] = str(self.data.dtype)
             if self.x_coords is not None:
-                state["x_coords"] = self.x_coords.tolist()
+                state["x_coords"] = _encode_array(self.x_coords)
+                state["x_coords_shape"] = list(self.x_coords.shape)
+                state["x_coords_dtype"] = str(self.x_coords.dtype)
             if self.y_coords is not None:
-                state["y_coords"] = self.y_coords.tolist()
+                state["y_coords"] = _encode_array(self.y_coords)
+                state["y_coords_shape"] = list(self.y_coords.shape)
+                state["y_coords_dtype"] = str(self.y_coords.dtype)
         
         return state
     
@@ -289,6 +534,40 @@ class BasePlot:
         state = self.get_state(include_data=include_data)
         return json.dumps(state, indent=indent, default=str)
     
+    def write_state_json(self, fp: Any, include_data: bool = False, chunk_bytes: int = 1 << 20) -> None:
+        """
+        Write current state as JSON to a text file object.
+        
+        Produces the same fields as get_state_json(), without indentation, but
+        data arrays are base64-encoded straight into fp in chunks. Peak memory
+        is therefore O(chunk_bytes) rather than a full encoded copy of the data.
+        
+        Args:
+            fp: Writable text file object
+            include_data: Whether to include data arrays in the state
+            chunk_bytes: Raw array bytes encoded per write
+        """
+        state = self._capture_state(include_data=False)
+        arrays = []
+        if include_data:
+            for name, array in (("data", self.data), ("x_coords", self.x_coords), ("y_coords", self.y_coords)):
+                if array is not None:
+                    arrays.append((name, array))
+                    state[f"{name}_shape"] = list(array.shape)
+                    state[f"{name}_dtype"] = str(array.dtype)
+        
+        fp.write("{")
+        separator = ""
+        for key, value in state.items():
+            fp.write(f"{separator}{json.dumps(key)}: ")
+            json.dump(value, fp, default=str)
+            separator = ", "
+        for name, array in arrays:
+            fp.write(f"{separator}{json.dumps(name)}: ")
+            _write_array_base64(fp, array, chunk_bytes)
+            separator = ", "
+        fp.write("}")
+    
     def load_state(self, state: Union[Dict[str, Any], str], restore_data: bool = False) -> None:
         """
         Load state from a dictionary or JSON string.
@@ -300,21 +579,15 @@ class BasePlot:
         if isinstance(state, str):
             state = json.loads(state)
         
-        # Restore all properties
-        self.title = state.get("title", self.title)
-        self.data_mode = DataMode(state.get("data_mode", self.data_mode.value))
-        self.palette = state.get("palette", self.palette)
-        self.color_scale = ColorScale(state.get("color_scale", self.color_scale.value))
-        self.range_mode = RangeMode(state.get("range_mode", self.range_mode.value))
-        self.range_min = state.get("range_min", self.range_min)
-        self.range_max = state.get("range_max", self.range_max)
-        self.plot_shape_mode = PlotShapeMode(state.get("plot_shape_mode", self.plot_shape_mode.value))
-        self.plot_width = state.get("plot_width", self.plot_width)
-        self.plot_height = state.get("plot_height", self.plot_height)
-        self.plot_min_size = state.get("plot_min_size", self.plot_min_size)
-        self.plot_max_size = state.get("plot_max_size", self.plot_max_size)
-        self.plot_scale = state.get("plot_scale", self.plot_scale)
-        self.crosshairs_enabled = state.get("crosshairs_enabled", self.crosshairs_enabled)
+        # Restore all properties present in the state; enum fields are stored by value
+        for name in self._STATE_FIELDS:
+            if name in state:
+                value = state[name]
+                enum_cls = self._ENUM_STATE_FIELDS.get(name)
+                if enum_cls is not None:
+                    value = _ENUM_BY_VALUE[enum_cls].get(value) or enum_cls(value)
+                setattr(self, name, value)
+        
         # Restore crosshair position from tuple (backward compatible with old format)
         crosshair = state.get("crosshair", None)
         if crosshair is not None and isinstance(crosshair, (list, tuple)) and len(crosshair) == 2:
@@ -325,31 +598,34 @@ class BasePlot:
             self.crosshair_y = state.get("crosshair_y", self.crosshair_y)
         # NOTE: Axis labels and ticks are NOT restored - they are automatically recalculated
         # from coordinate arrays when the plot is displayed. This keeps undo/redo state smaller.
-        # self.x_axis_label = state.get("x_axis_label", self.x_axis_label)
-        # self.y_axis_label = state.get("y_axis_label", self.y_axis_label)
-        # self.x_ticks = state.get("x_ticks", self.x_ticks)
-        # self.y_ticks = state.get("y_ticks", self.y_ticks)
-        # self.x_tick_labels = state.get("x_tick_labels", self.x_tick_labels)
-        # self.y_tick_labels = state.get("y_tick_labels", self.y_tick_labels)
-        self.select_region_enabled = state.get("select_region_enabled", self.select_region_enabled)
-        self.select_region_min_x = state.get("select_region_min_x", self.select_region_min_x)
-        self.select_region_min_y = state.get("select_region_min_y", self.select_region_min_y)
-        self.select_region_max_x = state.get("select_region_max_x", self.select_region_max_x)
-        self.select_region_max_y = state.get("select_region_max_y", self.select_region_max_y)
-        self.needs_flip = state.get("needs_flip", self.needs_flip)
         
         # Restore data if requested and available
         if restore_data:
+            # Values are base64 strings, or nested lists in states saved by older versions
             if "data" in state and "data_shape" in state:
-                self.data = np.array(state["data"]).reshape(tuple(state["data_shape"]))
+                self.data = _decode_array(state["data"], state.get("data_dtype"), state["data_shape"])
             if "x_coords" in state:
-                self.x_coords = np.array(state["x_coords"])
+                self.x_coords = _decode_array(
+                    state["x_coords"], state.get("x_coords_dtype"), state.get("x_coords_shape")
+                )
             if "y_coords" in state:
-                self.y_coords = np.array(state["y_coords"])
-        
-        # Recalculate range if dynamic
+                self.y_coords = _decode_array(
+                    state["y_coords"], state.get("y_coords_dtype"), state.get("y_coords_shape")
+                )
+        
+        # Recalculate range if dynamic. A state that carried its data also carries
+        # the range computed from that data, so there is nothing to recompute;
+        # otherwise the current data may differ from the saved one (repeat
+        # computations on unchanged data are served by the range cache).
         if self.range_mode == RangeMode.DYNAMIC and self.data is not None:
-            self._calculate_dynamic_range()
+            range_saved_with_data = (
+                restore_data
+                and "data" in state
+                and state.get("range_min") is not None
+                and state.get("range_max") is not None
+            )
+            if not range_saved_with_data:
+                self._calculate_dynamic_range()
         
         # Track this change
         if self.track_changes:
@@ -366,26 +642,65 @@ class BasePlot:
         if not self.track_changes:
             return
         
+        state = self._capture_state(include_data=False)
+        last_state = self._last_recorded_state
+        delta = {key: value for key, value in state.items() if key not in last_state or last_state[key] != value}
+        self._last_recorded_state = state
+        
         change_record = {
             "timestamp": datetime.now().isoformat(),
             "action": action,
             "details": details,
-            "state_snapshot": self._capture_state(include_data=False)
+            "delta": delta
         }
         self._change_history.append(change_record)
     
-    def get_change_history(self) -> List[Dict[str, Any]]:
+    def get_state_at(self, index: int) -> Dict[str, Any]:
+        """
+        Reconstruct the plot state (without data) right after a recorded change.
+        
+        Args:
+            index: Index into the change history (negative values count from the end)
+            
+        Returns:
+            Dictionary containing the plot state after that change
+            
+        Raises:
+            IndexError: If index is out of range
+        """
+        count = len(self._change_history)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"change history index out of range: {index}")
+        
+        state = dict(self._history_base)
+        for record in self._change_history[:index + 1]:
+            state.update(record["delta"])
+        return state
+    
+    def get_change_history(self, deep: bool = False) -> List[Dict[str, Any]]:
         """
         Get the history of state changes.
         
+        Each record is a fresh top-level dict, so callers can add keys (e.g.
+        plot_id) without touching the stored history. The nested details and
+        delta dicts are shared unless deep is True.
+        
+        Args:
+            deep: Return a fully independent deep copy of the records
+            
         Returns:
             List of change records
         """
-        return copy.deepcopy(self._change_history)
+        if deep:
+            return copy.deepcopy(self._change_history)
+        return [dict(record) for record in self._change_history]
     
     def clear_change_history(self) -> None:
         """Clear the change history."""
         self._change_history = []
+        self._history_base = self._last_recorded_state
     
     def reset_range(self) -> None:
         """Reset range to dynamic calculation based on current data."""
@@ -536,14 +851,25 @@ class BasePlot:
                 }
             })
     
-    def update_data(self, data: np.ndarray) -> None:
+    def update_data(self, data: np.ndarray, force: bool = False) -> None:
         """
         Update plot data and recalculate range if dynamic.
         
+        Passing the array the plot already holds is a no-op, so redraws that
+        hand back the same data skip the range computation and change record.
+        
         Args:
             data: New data array
+            force: Update even if data is the current array (use after
+                modifying the current array in place)
         """
+        if data is self.data and not force:
+            return
+        
         old_shape = self.data.shape if self.data is not None else None
+        if data is not None:
+            # The caller may have modified this array in place
+            invalidate_range_cache(data)
         self.data = data
         
         if self.range_mode == RangeMode.DYNAMIC:
@@ -555,6 +881,25 @@ class BasePlot:
                 "new_shape": list(data.shape) if data is not None else None
             })
     
+    def _coords_aspect_ratio(self) -> float:
+        """
+        Ratio of the y extent to the x extent of the coordinate arrays.
+        
+        The result is cached per pair of coordinate array objects; assigning new
+        coordinate arrays invalidates it. Returns 1.0 if either array is missing.
+        """
+        x_coords, y_coords = self.x_coords, self.y_coords
+        if x_coords is None or y_coords is None:
+            return 1.0
+        
+        cache = self._aspect_cache
+        if cache is not None and cache[0] is x_coords and cache[1] is y_coords:
+            return cache[2]
+        
+        aspect_ratio = np.ptp(y_coords) / np.ptp(x_coords)
+        self._aspect_cache = (x_coords, y_coords, aspect_ratio)
+        return aspect_ratio
+    
     def calculate_plot_dimensions(self) -> Tuple[int, int]:
         """
         Calculate plot dimensions based on current shape mode.
@@ -570,10 +915,7 @@ class BasePlot:
             height = max(self.plot_min_size, self.plot_height)
         
         elif self.plot_shape_mode == PlotShapeMode.ASPECT_RATIO:
-            if self.x_coords is not None and self.y_coords is not None:
-                aspect_ratio = (self.y_coords.max() - self.y_coords.min()) / (self.x_coords.max() - self.x_coords.min())
-            else:
-                aspect_ratio = 1.0
+            aspect_ratio = self._coords_aspect_ratio()
             
             scale_factor = self.plot_scale / 100.0
             base_size = int(self.plot_max_size * scale_factor)
@@ -611,8 +953,8 @@ class BasePlot:
             return self.data
         
         # Only flip 2D data (transpose)
-        if len(self.data.shape) == 2:
-            return np.transpose(self.data)
+        if self.data.ndim == 2:
+            return self.data.T
         
         # For other dimensions, return original (flipping not applicable)
         return self.data
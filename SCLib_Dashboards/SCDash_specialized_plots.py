@@ -21,6 +21,8 @@ class MAP_2DPlot(BasePlot):
     coordinate systems, crosshairs, and selection regions.
     """
     
+    __slots__ = ("_crosshair_h_line", "_crosshair_v_line")
+    
     def __init__(
         self,
         title: str = "Map View",
@@ -614,6 +616,8 @@ class PROBE_2DPlot(BasePlot):
     with support for selection regions and coordinate systems.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         title: str = "Probe View (2D)",
@@ -722,6 +726,8 @@ class PROBE_1DPlot(BasePlot):
     with support for range selection and coordinate systems.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         title: str = "Probe View (1D)",
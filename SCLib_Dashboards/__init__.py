@@ -38,6 +38,8 @@ from .SCDash_base_plot import (
     ColorScale,
     PlotShapeMode,
     RangeMode,
+    cached_percentile_range,
+    invalidate_range_cache,
 )
 
 from .SCDash_specialized_plots import (
@@ -95,6 +97,11 @@ from .SCDashUI_base_components import (
     create_label_div,
     create_spacer,
     create_separator,
+    WidgetPool,
+    release_widgets,
+    release_spacers,
+    hold_document,
+    batch_callbacks,
 )
 
 from .SCDashUI_plot_controls import (
@@ -105,10 +112,12 @@ from .SCDashUI_plot_controls import (
     create_palette_selector,
     create_palette_section,
     create_plot_shape_controls,
+    ShapeControls,
     create_range_mode_toggle,
     create_range_section_with_toggle,
     update_range_inputs_safely,
     DEFAULT_PALETTES,
+    DEFAULT_PALETTES_SET,
 )
 
 from .SCDashUI_dataset_selectors import (
@@ -117,6 +126,11 @@ from .SCDashUI_dataset_selectors import (
     create_coordinate_selector,
     create_dataset_selection_group,
     create_coordinate_selection_group,
+    release_selection_group,
+    LazySelect,
+    DatasetSelectionGroup,
+    CoordinateSelectionGroup,
+    OptionsRegistry,
     create_optional_plot_toggle,
     extract_dataset_path,
     extract_shape,
@@ -138,6 +152,7 @@ from .SCDashUI_layout_builders import (
     create_plot_with_controls_side_by_side,
     create_collapsible_tools_column,
     create_optimized_dashboard_layout,
+    add_dashboard_roots,
     create_header_banner,
 )
 
@@ -163,6 +178,8 @@ __all__ = [
     "ColorScale",
     "PlotShapeMode",
     "RangeMode",
+    "cached_percentile_range",
+    "invalidate_range_cache",
     # Specialized plot classes
     "MAP_2DPlot",
     "PROBE_2DPlot",
@@ -200,6 +217,11 @@ __all__.extend([
     "create_label_div",
     "create_spacer",
     "create_separator",
+    "WidgetPool",
+    "release_widgets",
+    "release_spacers",
+    "hold_document",
+    "batch_callbacks",
     # Plot controls
     "create_range_inputs",
     "create_range_section",
@@ -208,15 +230,22 @@ __all__.extend([
     "create_palette_selector",
     "create_palette_section",
     "create_plot_shape_controls",
+    "ShapeControls",
     "create_range_mode_toggle",
     "create_range_section_with_toggle",
     "DEFAULT_PALETTES",
+    "DEFAULT_PALETTES_SET",
     # Dataset selectors
     "create_dataset_selector",
     "create_mode_selector",
     "create_coordinate_selector",
     "create_dataset_selection_group",
     "create_coordinate_selection_group",
+    "release_selection_group",
+    "LazySelect",
+    "DatasetSelectionGroup",
+    "CoordinateSelectionGroup",
+    "OptionsRegistry",
     "create_optional_plot_toggle",
     "extract_dataset_path",
     "extract_shape",
@@ -236,6 +265,7 @@ __all__.extend([
     "create_plot_with_controls_side_by_side",
     "create_collapsible_tools_column",
     "create_optimized_dashboard_layout",
+    "add_dashboard_roots",
     "create_header_banner",
     # State synchronization
     "sync_plot_to_range_inputs",
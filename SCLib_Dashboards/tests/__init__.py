@@ -0,0 +1,3 @@
+"""
+Test package for SCLib_Dashboards
+"""
@@ -0,0 +1,71 @@
+"""
+Test cases for SCDashUI_base_components
+Tests widget pooling across rebuilds and documents.
+"""
+
+import unittest
+from unittest import mock
+
+from bokeh.document import Document
+from bokeh.models import Column, CustomJS, Select
+
+from SCLib_Dashboards import SCDashUI_base_components as base_components
+from SCLib_Dashboards.SCDashUI_base_components import WidgetPool
+
+
+class TestWidgetPool(unittest.TestCase):
+    """Test cases for WidgetPool."""
+    
+    def setUp(self):
+        self.pool = WidgetPool()
+        self.doc = Document()
+        patcher = mock.patch.object(base_components, "curdoc", side_effect=lambda: self.doc)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _released_select(self):
+        widget = self.pool.acquire(Select, title="Dataset", options=["a", "b"], value="a")
+        widget.visible = False
+        widget.disabled = True
+        widget.on_change("value", lambda attr, old, new: None)
+        widget.js_on_change("value", CustomJS(code=""))
+        self.pool.release(widget)
+        return widget
+    
+    def test_reused_widget_is_reset(self):
+        """A reused widget has default properties and no callbacks."""
+        released = self._released_select()
+        
+        widget = self.pool.acquire(Select, title="Other", options=["c"], value="c")
+        self.assertIs(widget, released)
+        self.assertEqual(widget.title, "Other")
+        self.assertEqual(widget.options, ["c"])
+        self.assertTrue(widget.visible)
+        self.assertFalse(widget.disabled)
+        self.assertEqual(widget.js_property_callbacks, {})
+        self.assertFalse(widget._callbacks)
+    
+    def test_widgets_are_not_shared_across_documents(self):
+        """A widget released in one document is not handed out in another."""
+        first_doc = self.doc
+        released = self._released_select()
+        first_doc.add_root(Column(released))
+        
+        self.doc = Document()
+        widget = self.pool.acquire(Select, title="Dataset")
+        self.assertIsNot(widget, released)
+        # Adding the new widget to the second document must not raise
+        self.doc.add_root(Column(widget))
+        
+        self.doc = first_doc
+        self.assertIs(self.pool.acquire(Select, title="Dataset"), released)
+    
+    def test_clear_drops_pooled_widgets(self):
+        """clear() empties the pool."""
+        released = self._released_select()
+        self.pool.clear()
+        self.assertIsNot(self.pool.acquire(Select), released)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Test cases for SCDashUI_dataset_selectors
+Tests shared option lists for dataset selectors.
+"""
+
+import unittest
+
+from SCLib_Dashboards.SCDashUI_dataset_selectors import OptionsRegistry, create_dataset_selection_group
+
+
+class TestOptionsRegistry(unittest.TestCase):
+    """Test cases for OptionsRegistry."""
+    
+    def setUp(self):
+        self.registry = OptionsRegistry()
+        self.group = create_dataset_selection_group(
+            "Plot1",
+            ["/a (10x10)", "/b (10x10)"],
+            default_dataset="/a (10x10)",
+            options_registry=self.registry,
+        )
+    
+    def test_bound_selects_keep_server_side_options(self):
+        """Bound Selects expose the real options to Python code."""
+        for select in self.group[1:]:
+            self.assertEqual(select.options, ["/a (10x10)", "/b (10x10)"])
+    
+    def test_update_reaches_every_bound_select(self):
+        """update() replaces the options of all Selects bound to the key."""
+        self.registry.update("datasets:Plot1", ["/c (5x5)"])
+        for select in self.group[1:]:
+            self.assertEqual(select.options, ["/c (5x5)"])
+        self.assertEqual(self.registry.options("datasets:Plot1"), ["/c (5x5)"])
+
+
+if __name__ == '__main__':
+    unittest.main()
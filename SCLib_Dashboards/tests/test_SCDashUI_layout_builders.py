@@ -0,0 +1,89 @@
+"""
+Test cases for SCDashUI_layout_builders
+Tests layout stylesheets across documents and the tools panel toggle.
+"""
+
+import unittest
+
+from bokeh.document import Document
+from bokeh.events import ButtonClick
+from bokeh.layouts import column
+from bokeh.models import Button, Div
+
+from SCLib_Dashboards.SCDashUI_layout_builders import (
+    create_collapsible_tools_column,
+    create_optimized_dashboard_layout,
+    create_tools_column,
+)
+
+
+class TestLayoutStylesheets(unittest.TestCase):
+    """Test cases for the stylesheets attached to dashboard layouts."""
+    
+    def test_layouts_in_separate_documents(self):
+        """Layouts built for two documents do not share stylesheet models."""
+        first = create_tools_column([Div(text="a")])
+        second = create_tools_column([Div(text="b")])
+        self.assertIsNot(first.stylesheets[0], second.stylesheets[0])
+        
+        Document().add_root(first)
+        # Raises if a model of the first layout is reused here
+        Document().add_root(second)
+
+
+
+class TestToolsPanelToggle(unittest.TestCase):
+    """Test cases for the collapse button of create_optimized_dashboard_layout."""
+    
+    def test_rapid_clicks_all_toggle(self):
+        """Back-to-back clicks are each applied, none are dropped."""
+        tools = column(Div(text="tools"))
+        layout = create_optimized_dashboard_layout(
+            tools, column(), Div(), column(), Div(), column(), Div()
+        )
+        button = next(
+            model for model in layout.select({"type": Button})
+            if "collapse-btn" in model.css_classes
+        )
+        
+        for expected_visible in (False, True, False):
+            button._trigger_event(ButtonClick(button))
+            self.assertEqual(tools.visible, expected_visible)
+    
+    def test_click_on_externally_hidden_column_keeps_state(self):
+        """A no-op click does not flip the collapsed state."""
+        tools = column(Div(text="tools"))
+        layout = create_optimized_dashboard_layout(
+            tools, column(), Div(), column(), Div(), column(), Div()
+        )
+        button = next(
+            model for model in layout.select({"type": Button})
+            if "collapse-btn" in model.css_classes
+        )
+        
+        tools.visible = False
+        button._trigger_event(ButtonClick(button))
+        self.assertEqual(button.label, "◀")
+        
+        tools.visible = True
+        button._trigger_event(ButtonClick(button))
+        self.assertFalse(tools.visible)
+        self.assertEqual(button.label, "▶")
+    
+    def test_collapsible_column_click_on_hidden_column_keeps_state(self):
+        """The collapsible column helper skips no-op clicks the same way."""
+        tools_col_with_toggle, button = create_collapsible_tools_column([Div(text="tools")])
+        tools_col = tools_col_with_toggle.children[1]
+        
+        tools_col.visible = False
+        button._trigger_event(ButtonClick(button))
+        self.assertEqual(button.label, "◀")
+        
+        tools_col.visible = True
+        button._trigger_event(ButtonClick(button))
+        self.assertFalse(tools_col.visible)
+        self.assertEqual(button.label, "▶")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Test cases for SCDashUI_sync
+Tests synchronization between plot state and control widgets.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from bokeh.models import Select
+
+from SCLib_Dashboards.SCDash_base_plot import BasePlot, PlotShapeMode
+from SCLib_Dashboards.SCDashUI_plot_controls import create_plot_shape_controls
+from SCLib_Dashboards.SCDashUI_sync import sync_palette_selector_to_plot, sync_plot_to_shape_controls
+
+
+class TestShapeControlSync(unittest.TestCase):
+    """Test cases for sync_plot_to_shape_controls."""
+    
+    def setUp(self):
+        self.plot = BasePlot(plot_shape_mode=PlotShapeMode.CUSTOM, plot_width=500, plot_height=300)
+        self.controls = create_plot_shape_controls()
+    
+    def test_repeated_sync_restores_edited_inputs(self):
+        """A second sync with unchanged plot state still overwrites user edits."""
+        sync_plot_to_shape_controls(self.plot, self.controls)
+        self.assertEqual(self.controls.custom_width_input.value, "500")
+        self.assertEqual(self.controls.shape_selector.active, 1)
+        
+        self.controls.custom_width_input.value = "not a number"
+        self.controls.shape_selector.active = 0
+        sync_plot_to_shape_controls(self.plot, self.controls)
+        self.assertEqual(self.controls.custom_width_input.value, "500")
+        self.assertEqual(self.controls.shape_selector.active, 1)
+        self.assertEqual(self.controls.custom_height_input.value, "300")
+
+
+
+class TestPaletteSelectorSync(unittest.TestCase):
+    """Test cases for sync_palette_selector_to_plot."""
+    
+    def setUp(self):
+        self.plot = BasePlot()
+    
+    def test_value_label_options_are_accepted(self):
+        """Custom palettes given as (value, label) options are applied."""
+        selector = Select(options=[("MyPalette", "My palette")], value="MyPalette")
+        sync_palette_selector_to_plot(self.plot, selector)
+        self.assertEqual(self.plot.palette, "MyPalette")
+    
+    def test_grouped_options_are_accepted(self):
+        """Custom palettes inside option groups are applied."""
+        selector = Select(options={"Custom": ["MyPalette"]}, value="MyPalette")
+        sync_palette_selector_to_plot(self.plot, selector)
+        self.assertEqual(self.plot.palette, "MyPalette")
+    
+    def test_unknown_value_is_rejected_with_warning(self):
+        """Values outside the options leave the palette alone and are reported."""
+        selector = Select(options=["Viridis256"], value="Bogus")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            sync_palette_selector_to_plot(self.plot, selector)
+        self.assertEqual(self.plot.palette, "Viridis256")
+        self.assertIn("Bogus", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+Test cases for SCDashUI_undo_redo
+Tests state history snapshots, round trips, deduplication and restore.
+"""
+
+import json
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from SCLib_Dashboards import SCDashUI_undo_redo as undo_redo
+from SCLib_Dashboards.SCDash_base_plot import BasePlot, RangeMode
+from SCLib_Dashboards.SCDashUI_undo_redo import PlotStateHistory, StateHistory
+
+
+def _json_dumps(state):
+    """The stdlib json serializer used when orjson is not installed."""
+    return json.dumps(state, default=undo_redo._to_builtin).encode()
+
+
+class TestStateSerialization(unittest.TestCase):
+    """Test cases for the snapshot serializer."""
+    
+    def test_numpy_values_round_trip_as_numbers(self):
+        """NumPy scalars and arrays come back as Python numbers and lists."""
+        state = {
+            "f32": np.float32(0.5),
+            "i64": np.int64(3),
+            "flag": np.bool_(True),
+            "array": np.arange(3),
+        }
+        for dumps in (undo_redo._dumps, _json_dumps):
+            restored = json.loads(dumps(state))
+            self.assertEqual(restored, {"f32": 0.5, "i64": 3, "flag": True, "array": [0, 1, 2]})
+            self.assertIsInstance(restored["f32"], float)
+    
+    def test_compression_round_trip(self):
+        """Compressed payloads decompress to the serialized bytes."""
+        blob = undo_redo._dumps({"palette": "Viridis256", "values": list(range(100))})
+        payload = undo_redo._compress(blob)
+        self.assertIsInstance(payload, bytes)
+        self.assertEqual(undo_redo._decompress(payload), blob)
+
+
+class TestPlotStateHistory(unittest.TestCase):
+    """Test cases for PlotStateHistory."""
+    
+    def _make_plot(self):
+        plot = BasePlot(range_mode=RangeMode.USER_SPECIFIED)
+        plot.range_min = np.float32(0.5)
+        plot.range_max = np.float32(2.0)
+        return plot
+    
+    def _check_undo_restores_numeric_range(self):
+        plot = self._make_plot()
+        history = PlotStateHistory(plot)
+        
+        plot.set_palette("Plasma256")
+        self.assertTrue(history.save_state("Palette changed"))
+        self.assertTrue(history.undo())
+        
+        self.assertEqual(plot.palette, "Viridis256")
+        self.assertEqual(plot.range_min, 0.5)
+        self.assertNotIsInstance(plot.range_min, str)
+        self.assertEqual(plot.range_max, 2.0)
+        self.assertNotIsInstance(plot.range_max, str)
+        
+        self.assertTrue(history.redo())
+        self.assertEqual(plot.palette, "Plasma256")
+    
+    def test_undo_restores_numeric_range(self):
+        """Undo restores numpy-typed ranges as numbers with the active serializer."""
+        self._check_undo_restores_numeric_range()
+    
+    def test_undo_restores_numeric_range_with_json_fallback(self):
+        """Undo restores numpy-typed ranges as numbers when orjson is missing."""
+        with mock.patch.object(undo_redo, "_dumps", _json_dumps), \
+                mock.patch.object(undo_redo, "_loads", json.loads):
+            self._check_undo_restores_numeric_range()
+    
+    def test_unchanged_state_is_not_saved(self):
+        """Saving an identical state is skipped."""
+        plot = self._make_plot()
+        history = PlotStateHistory(plot)
+        
+        self.assertFalse(history.save_state("No change"))
+        self.assertEqual(len(history.history), 1)
+        
+        plot.set_palette("Plasma256")
+        self.assertTrue(history.save_state("Palette changed"))
+        self.assertEqual(len(history.history), 2)
+    
+    def test_snapshots_are_stored_as_bytes(self):
+        """History entries keep the payload as bytes next to the metadata."""
+        plot = self._make_plot()
+        history = PlotStateHistory(plot)
+        
+        entry = history.history[0]
+        self.assertIsInstance(entry["payload"], bytes)
+        self.assertEqual(entry["description"], "Initial state")
+        self.assertEqual(
+            undo_redo._loads(undo_redo._decompress(entry["payload"])),
+            undo_redo._loads(undo_redo._dumps(plot.get_state(include_data=False))),
+        )
+    
+    def test_history_is_bounded(self):
+        """The oldest states are dropped beyond max_history."""
+        plot = self._make_plot()
+        history = PlotStateHistory(plot, max_history=3)
+        
+        for palette in ("Plasma256", "Inferno256", "Magma256", "Cividis256"):
+            plot.set_palette(palette)
+            history.save_state(palette)
+        
+        self.assertEqual(len(history.history), 3)
+        self.assertEqual(history.current_index, 2)
+        self.assertEqual(
+            [item["description"] for item in history.get_history_summary()],
+            ["Inferno256", "Magma256", "Cividis256"],
+        )
+    
+    def test_new_save_after_undo_drops_redo_states(self):
+        """Saving after an undo discards the redo branch."""
+        plot = self._make_plot()
+        history = PlotStateHistory(plot)
+        
+        plot.set_palette("Plasma256")
+        history.save_state("Plasma")
+        history.undo()
+        plot.set_palette("Magma256")
+        history.save_state("Magma")
+        
+        self.assertFalse(history.can_redo())
+        self.assertEqual(
+            [item["description"] for item in history.get_history_summary()],
+            ["Initial state", "Magma"],
+        )
+    
+    def test_summary_tracks_current_index(self):
+        """The cached summary is refreshed after undo."""
+        plot = self._make_plot()
+        history = PlotStateHistory(plot)
+        plot.set_palette("Plasma256")
+        history.save_state("Plasma")
+        
+        self.assertTrue(history.get_history_summary()[1]["is_current"])
+        history.undo()
+        summary = history.get_history_summary()
+        self.assertTrue(summary[0]["is_current"])
+        self.assertFalse(summary[1]["is_current"])
+    
+    def test_restored_state_is_not_saved_again(self):
+        """A save right after undo sees the restored state as unchanged."""
+        plot = self._make_plot()
+        history = PlotStateHistory(plot)
+        plot.set_palette("Plasma256")
+        history.save_state("Plasma")
+        
+        history.undo()
+        self.assertFalse(history.save_state("Widget echo"))
+        self.assertTrue(history.can_redo())
+    
+    def test_scheduled_initial_state_is_captured_at_construction(self):
+        """Setup changes made before the scheduled tick are not the initial state."""
+        plot = self._make_plot()
+        scheduled = []
+        history = PlotStateHistory(plot, schedule=scheduled.append)
+        self.assertEqual(len(history.history), 0)
+        
+        plot.set_palette("Plasma256")
+        scheduled[0]()
+        self.assertEqual(len(history.history), 1)
+        self.assertTrue(history.save_state("Palette changed"))
+        self.assertTrue(history.undo())
+        self.assertEqual(plot.palette, "Viridis256")
+    
+    def test_save_before_scheduled_tick_stores_initial_state_first(self):
+        """A save that beats the scheduled tick records the initial state first."""
+        plot = self._make_plot()
+        scheduled = []
+        history = PlotStateHistory(plot, schedule=scheduled.append)
+        
+        plot.set_palette("Plasma256")
+        self.assertTrue(history.save_state("Palette changed"))
+        scheduled[0]()
+        self.assertEqual(
+            [entry["description"] for entry in history.history],
+            ["Initial state", "Palette changed"],
+        )
+
+
+class TestStateHistory(unittest.TestCase):
+    """Test cases for the StateHistory base class."""
+    
+    def test_save_without_callbacks(self):
+        """save_state returns False until callbacks are set."""
+        history = StateHistory()
+        self.assertFalse(history.save_state())
+        self.assertFalse(history.undo())
+    
+    def test_histories_have_no_instance_dict(self):
+        """History objects use __slots__."""
+        for history in (StateHistory(), PlotStateHistory(BasePlot())):
+            self.assertFalse(hasattr(history, "__dict__"))
+    
+    def test_clear(self):
+        """clear() empties history and allows saving the same state again."""
+        state = {"value": 1}
+        history = StateHistory()
+        history.set_callbacks(lambda: dict(state), lambda restored: state.update(restored))
+        self.assertTrue(history.save_state())
+        history.clear()
+        self.assertEqual(len(history.history), 0)
+        self.assertTrue(history.save_state())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Test cases for SCDash_4d_session
+Tests building a 4D session from a processor's dataset selections.
+"""
+
+import unittest
+
+from SCLib_Dashboards.SCDash_4d_session import create_4d_session_from_process_4dnexus
+
+
+class _SlottedProcessor:
+    """Processor stand-in whose selections are slots, a property and a class attribute."""
+    
+    __slots__ = ("volume_picked", "_presample")
+    
+    x_coords_picked = "/map/x"
+    
+    def __init__(self):
+        self.volume_picked = "/entry/volume"
+        self._presample = "/entry/presample"
+    
+    @property
+    def presample_picked(self):
+        return self._presample
+
+
+class TestCreate4dSession(unittest.TestCase):
+    """Test cases for create_4d_session_from_process_4dnexus."""
+    
+    def test_selections_read_through_attribute_lookup(self):
+        """Slots, properties and class attributes are all picked up."""
+        session = create_4d_session_from_process_4dnexus(_SlottedProcessor())
+        metadata = session.metadata
+        self.assertEqual(metadata["volume_picked"], "/entry/volume")
+        self.assertEqual(metadata["presample_picked"], "/entry/presample")
+        self.assertEqual(metadata["x_coords_picked"], "/map/x")
+        self.assertIsNone(metadata["volume_picked_b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
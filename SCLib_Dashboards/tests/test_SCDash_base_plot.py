@@ -0,0 +1,191 @@
+"""
+Test cases for SCDash_base_plot
+Tests percentile range estimation on sampled images, state serialization
+and the change history.
+"""
+
+import io
+import json
+import unittest
+
+import numpy as np
+
+from SCLib_Dashboards.SCDash_base_plot import (
+    BasePlot,
+    SAMPLE_CAP,
+    _percentile_range,
+    cached_percentile_range,
+    invalidate_range_cache,
+)
+
+
+def _column_ramp(rows, cols):
+    """An image whose values increase from 0 to 1 across its columns."""
+    return np.tile(np.linspace(0.0, 1.0, cols), (rows, 1))
+
+
+class TestPercentileRange(unittest.TestCase):
+    """Test cases for _percentile_range."""
+    
+    def test_small_arrays_match_nanpercentile(self):
+        """Unsampled arrays give the same range as np.nanpercentile."""
+        with_nans = np.random.default_rng(2).random((50, 40))
+        with_nans[::3, ::5] = np.nan
+        cases = (
+            np.arange(16.0).reshape(4, 4),
+            np.arange(16).reshape(4, 4),
+            np.array([3, 1, 2], dtype=np.uint8),
+            np.array([7.5]),
+            with_nans,
+        )
+        for data in cases:
+            expected = np.nanpercentile(data, [1, 99])
+            np.testing.assert_allclose(_percentile_range(data), expected)
+    
+    def test_sampled_image_sees_every_column(self):
+        """A sample of a large image is not aliased with its row width."""
+        for rows, cols in ((100_000, 100), (2_000, 500)):
+            data = _column_ramp(rows, cols)
+            self.assertGreater(data.size, SAMPLE_CAP)
+            
+            p1, p99 = _percentile_range(data)
+            expected_p1, expected_p99 = np.percentile(data, [1, 99])
+            self.assertAlmostEqual(p1, expected_p1, delta=0.02)
+            self.assertAlmostEqual(p99, expected_p99, delta=0.02)
+    
+    def test_sample_is_reproducible(self):
+        """Repeated calls on the same large image give the same range."""
+        data = np.random.default_rng(1).random((400, 300))
+        self.assertEqual(_percentile_range(data), _percentile_range(data))
+    
+    def test_nan_values_are_ignored(self):
+        """NaNs are dropped before the percentiles are taken."""
+        data = _column_ramp(1_000, 200)
+        data[:, ::7] = np.nan
+        p1, p99 = _percentile_range(data)
+        self.assertFalse(np.isnan(p1))
+        self.assertFalse(np.isnan(p99))
+        self.assertIsNone(_percentile_range(np.full((3, 3), np.nan)))
+    
+    def test_input_is_not_modified(self):
+        """Partitioning the sample leaves the caller's array untouched."""
+        data = np.arange(100, 0, -1).reshape(10, 10)
+        original = data.copy()
+        _percentile_range(data)
+        np.testing.assert_array_equal(data, original)
+
+
+    
+    def test_cached_range_until_invalidated(self):
+        """The cached range is reused until the array is invalidated."""
+        data = np.arange(100.0)
+        first = cached_percentile_range(data)
+        data *= 2
+        self.assertEqual(cached_percentile_range(data), first)
+        
+        invalidate_range_cache(data)
+        self.assertEqual(cached_percentile_range(data), _percentile_range(data))
+        self.assertNotEqual(cached_percentile_range(data), first)
+
+
+class TestStateSerialization(unittest.TestCase):
+    """Test cases for saving and restoring plot data through JSON states."""
+    
+    def setUp(self):
+        data = np.random.default_rng(3).random((30, 20), dtype=np.float32)
+        self.plot = BasePlot(
+            data=data.T,  # non-contiguous view
+            x_coords=np.linspace(-1.0, 1.0, 20),
+            y_coords=np.arange(30, dtype=np.int16),
+            palette="Plasma256",
+        )
+    
+    def _assert_restored(self, state):
+        restored = BasePlot()
+        restored.load_state(state, restore_data=True)
+        for name in ("data", "x_coords", "y_coords"):
+            original = getattr(self.plot, name)
+            array = getattr(restored, name)
+            self.assertEqual(array.dtype, original.dtype)
+            self.assertEqual(array.shape, original.shape)
+            np.testing.assert_array_equal(array, original)
+            self.assertTrue(array.flags.writeable)
+        self.assertEqual(restored.palette, "Plasma256")
+        self.assertEqual((restored.range_min, restored.range_max), (self.plot.range_min, self.plot.range_max))
+    
+    def test_base64_state_round_trip(self):
+        """Arrays saved as base64 come back with their dtype, shape and values."""
+        state_json = self.plot.get_state_json(include_data=True)
+        self.assertIsInstance(json.loads(state_json)["data"], str)
+        self._assert_restored(state_json)
+    
+    def test_write_state_json_matches_get_state_json(self):
+        """Streaming the state in small chunks writes the same fields."""
+        for chunk_bytes in (1, 10, 1 << 20):
+            fp = io.StringIO()
+            self.plot.write_state_json(fp, include_data=True, chunk_bytes=chunk_bytes)
+            self.assertEqual(json.loads(fp.getvalue()), json.loads(self.plot.get_state_json(include_data=True)))
+            self._assert_restored(fp.getvalue())
+    
+    def test_nested_list_states_still_load(self):
+        """States saved with nested lists by older versions are restored."""
+        state = self.plot.get_state(include_data=False)
+        state.update(data=[[1.0, 2.0], [3.0, 4.0]], data_shape=[2, 2])
+        restored = BasePlot()
+        restored.load_state(state, restore_data=True)
+        np.testing.assert_array_equal(restored.data, [[1.0, 2.0], [3.0, 4.0]])
+
+
+class TestChangeHistory(unittest.TestCase):
+    """Test cases for BasePlot change records."""
+    
+    def setUp(self):
+        self.plot = BasePlot(track_changes=True)
+        self.plot.set_palette("Plasma256")
+        self.plot.set_range(1.0, 5.0)
+    
+    def test_records_carry_only_changed_fields(self):
+        """Each record's delta holds just the fields its change moved."""
+        history = self.plot.get_change_history()
+        self.assertEqual([record["action"] for record in history], ["set_palette", "set_range"])
+        
+        first, second = (record["delta"] for record in history)
+        self.assertEqual(first, {"palette": "Plasma256"})
+        self.assertEqual(second["range_max"], 5.0)
+        self.assertNotIn("palette", second)
+    
+    def test_get_state_at(self):
+        """get_state_at replays the deltas into a full state."""
+        self.assertEqual(self.plot.get_state_at(-1), self.plot.get_state())
+        self.assertEqual(set(self.plot.get_state_at(0)), set(self.plot.get_state()))
+        self.assertNotEqual(self.plot.get_state_at(0)["range_max"], 5.0)
+        
+        self.plot.get_state_at(0)["palette"] = "Greys256"
+        self.assertEqual(self.plot.get_state_at(0)["palette"], "Plasma256")
+        with self.assertRaises(IndexError):
+            self.plot.get_state_at(2)
+    
+    def test_returned_records_are_independent(self):
+        """Callers can annotate returned records without touching the history."""
+        for record in self.plot.get_change_history():
+            record["plot_id"] = "plot1"
+        self.assertNotIn("plot_id", self.plot.get_change_history()[0])
+        
+        deep = self.plot.get_change_history(deep=True)
+        deep[0]["delta"]["palette"] = "Greys256"
+        self.assertEqual(self.plot.get_state_at(0)["palette"], "Plasma256")
+    
+    def test_clear_change_history(self):
+        """Clearing drops the records; later states build on the cleared state."""
+        self.plot.clear_change_history()
+        self.assertEqual(self.plot.get_change_history(), [])
+        
+        self.plot.set_palette("Viridis256")
+        state = self.plot.get_state_at(0)
+        self.assertEqual(state["palette"], "Viridis256")
+        self.assertEqual(state["range_max"], 5.0)
+        self.assertEqual(state, self.plot.get_state())
+
+
+if __name__ == '__main__':
+    unittest.main()